@@ -7,8 +7,8 @@ from typing import Optional
 
 import numpy as np
 
-from src.ai.embeddings import Embedder
-from src.ai.summarizer import Summarizer
+from src.ai.embeddings import Embedder, get_embedder
+from src.ai.summarizer import Summarizer, get_summarizer
 from src.config import Config
 from src.storage.vectors import ContentVector, VectorStore
 
@@ -39,13 +39,13 @@ class ConnectionFinder:
     def _get_embedder(self) -> Embedder:
         """Lazy load embedder."""
         if self._embedder is None:
-            self._embedder = Embedder()
+            self._embedder = get_embedder()
         return self._embedder
 
     def _get_summarizer(self) -> Summarizer:
         """Lazy load summarizer."""
         if self._summarizer is None:
-            self._summarizer = Summarizer(self.config)
+            self._summarizer = get_summarizer(self.config)
         return self._summarizer
 
     def find_connections(
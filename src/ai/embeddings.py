@@ -1,5 +1,7 @@
 """Embedding generation for semantic search."""
 
+import asyncio
+import functools
 import logging
 from typing import Optional
 
@@ -7,6 +9,21 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Coalescing window for embed_async: how long a call waits for other
+# concurrent callers to join its batch, and the largest batch flushed
+_COALESCE_WAIT = 0.05  # seconds
+_COALESCE_MAX = 16
+
+
+@functools.lru_cache(maxsize=1)
+def get_embedder(model_name: str = "all-MiniLM-L6-v2") -> "Embedder":
+    """Shared Embedder singleton.
+
+    The sentence-transformers model is hundreds of MB; one process-wide
+    instance means it loads into RAM once, not once per processor.
+    """
+    return Embedder(model_name)
+
 
 class Embedder:
     """Generate embeddings using sentence-transformers."""
@@ -21,6 +38,9 @@ class Embedder:
         """
         self.model_name = model_name
         self._model = None
+        # Pending (text, future) pairs for embed_async coalescing
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     def _get_model(self):
         """Lazy load the embedding model."""
@@ -68,6 +88,40 @@ class Embedder:
         embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=True)
         return embeddings
 
+    async def embed_async(self, text: str) -> np.ndarray:
+        """Embed one text, coalescing concurrent callers into a batch.
+
+        The model is far more throughput-efficient on batches than on
+        single inputs, so each call waits a short window for other
+        concurrent calls to join, then one embed_batch runs off the
+        event loop and every caller gets its own row. A lone caller
+        pays only the window (50ms) on top of the encode.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((text, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_pending())
+        return await future
+
+    async def _flush_pending(self) -> None:
+        """Drain the pending queue in batches of _COALESCE_MAX."""
+        await asyncio.sleep(_COALESCE_WAIT)
+        while self._pending:
+            batch = self._pending[:_COALESCE_MAX]
+            del self._pending[:_COALESCE_MAX]
+            texts = [text for text, _ in batch]
+            try:
+                embeddings = await asyncio.to_thread(self.embed_batch, texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), embedding in zip(batch, embeddings):
+                    if not future.done():
+                        future.set_result(embedding)
+
     def similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """Calculate cosine similarity between two embeddings."""
         norm1 = np.linalg.norm(embedding1)
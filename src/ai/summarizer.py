@@ -1,5 +1,6 @@
 """Claude-powered summarization and insight extraction."""
 
+import functools
 import json
 import logging
 from typing import Optional
@@ -11,6 +12,17 @@ from src.config import Config
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def get_summarizer(config: Config) -> "Summarizer":
+    """Shared Summarizer per Config.
+
+    Config is frozen (hashable), so every processor working off the same
+    config reuses one Summarizer and its Anthropic client instead of
+    constructing a fresh client apiece.
+    """
+    return Summarizer(config)
+
+
 class Summarizer:
     """Handles AI-powered summarization using Claude."""
 
@@ -3,12 +3,12 @@
 import asyncio
 import logging
 import re
-import smtplib
+from dataclasses import dataclass, field
 from typing import Optional
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from urllib.parse import urlsplit
 from pathlib import Path
 
+import orjson
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     Application,
@@ -19,18 +19,21 @@ from telegram.ext import (
     ConversationHandler,
     filters,
 )
+from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 
 from src.config import get_config, init_config
+from src.ai.summarizer import Summarizer
 from src.processors.podcast import PodcastProcessor
 from src.processors.article import ArticleProcessor
 from src.processors.thread import ThreadProcessor
-from src.storage.vault import VaultWriter
+from src.storage.vault import VaultWriter, PodcastMetadata
 from src.storage.vectors import VectorStore
 from src.storage.summaries import SummaryStorage
 from src.storage.categories import CategoryStorage
 from src.ai.learning import LearningSystem
 from src.digest.daily import DailyDigest, DigestScheduler
-from src.security import AccessControl, sanitize_error_message, validate_url
+from src.security import AccessControl, async_validate_url, sanitize_error_message
 
 # Set up logging
 logging.basicConfig(
@@ -44,6 +47,83 @@ PODCAST_MODE_SELECT = 1
 PODCAST_INTERACTIVE = 2
 PODCAST_REVIEW = 3
 
+# Fixed HTML shell for email bodies - built once instead of re-allocating
+# the CSS on every send
+_HTML_SHELL_PREFIX = (
+    '<html>\n'
+    '<body style="font-family: -apple-system, BlinkMacSystemFont, \'Segoe UI\', '
+    'Roboto, Helvetica, Arial, sans-serif; line-height: 1.6; color: #333; '
+    'max-width: 600px; margin: 0 auto; padding: 20px;">\n'
+    '<p>'
+)
+_HTML_SHELL_SUFFIX = '</p>\n</body>\n</html>'
+
+# Markdown-to-HTML patterns, compiled once
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'(?<![a-zA-Z])_([^_]+)_(?![a-zA-Z])')
+
+# Hot-path patterns for the message handler, compiled once
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+URL_RE = re.compile(r"https?://[^\s]+")
+
+# Hostname suffixes recognized as podcast links
+_PODCAST_HOSTS = ("spotify.com", "podcasts.apple.com")
+
+# Fixed callback_data values per handler - passing set.__contains__ as the
+# CallbackQueryHandler pattern replaces a regex match with a hash lookup
+_PODCAST_MODE_CALLBACKS = frozenset({"podcast_mode_1", "podcast_mode_2"})
+_PODCAST_REVIEW_CALLBACKS = frozenset({"podcast_approve", "podcast_feedback", "podcast_cancel"})
+_SAVED_CALLBACKS = frozenset({
+    "saved_edit", "saved_email", "saved_move", "saved_delete",
+    "saved_delete_confirm", "saved_delete_cancel", "saved_back", "saved_done",
+    "email_quick_send", "email_enter_new", "email_cancel",
+})
+_EDIT_CALLBACKS = frozenset({"edit_save", "edit_more", "edit_cancel"})
+
+
+def _is_folder_callback(data: str) -> bool:
+    """Folder callbacks embed dynamic IDs, so match on prefix."""
+    return data.startswith(("folder_", "summary_move"))
+
+
+class ORJSONRequest(HTTPXRequest):
+    """HTTPXRequest that decodes Bot API responses with orjson (C-level JSON)."""
+
+    def parse_json_payload(self, payload: bytes) -> dict:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError as exc:
+            # Match the base-class contract: the network retry loop only
+            # catches TelegramError, and non-JSON responses happen (e.g.
+            # an HTML 502 page during an outage)
+            raise TelegramError("Invalid server response") from exc
+
+
+@dataclass(slots=True)
+class UserState:
+    """Pending text-input state for a user - one mode active at a time."""
+    mode: str  # 'feedback', 'edit', or 'email'
+    payload: dict = field(default_factory=dict)
+
+
+# Review keyboards are immutable for a given button set - build them once
+# instead of re-allocating on every draft/regeneration round trip
+PODCAST_REVIEW_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("✅ Approve & Save", callback_data="podcast_approve")],
+    [InlineKeyboardButton("✏️ Provide Feedback", callback_data="podcast_feedback")],
+    [InlineKeyboardButton("❌ Cancel", callback_data="podcast_cancel")],
+])
+PODCAST_REGEN_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("✅ Approve & Save", callback_data="podcast_approve")],
+    [InlineKeyboardButton("✏️ More Feedback", callback_data="podcast_feedback")],
+    [InlineKeyboardButton("❌ Cancel", callback_data="podcast_cancel")],
+])
+EDIT_REVIEW_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("✅ Save Changes", callback_data="edit_save")],
+    [InlineKeyboardButton("✏️ More Feedback", callback_data="edit_more")],
+    [InlineKeyboardButton("❌ Cancel", callback_data="edit_cancel")],
+])
+
 
 class KnowledgeBot:
     """Main bot class coordinating all components."""
@@ -55,8 +135,9 @@ class KnowledgeBot:
         self.summary_storage = SummaryStorage(self.config.obsidian.vault_path / ".summaries.json")
         self.category_storage = CategoryStorage(self.config.obsidian.vault_path / ".categories.json")
         self.learning = LearningSystem(self.config.obsidian.vault_path / ".learning.json")
+        self._summarizer = Summarizer(self.config)
         self.podcast_processor = PodcastProcessor(self.config, self.vault)
-        self.article_processor = ArticleProcessor(self.config, self.vault)
+        self.article_processor = ArticleProcessor(self.config, self.vault, self.vector_store)
         self.thread_processor = ThreadProcessor(self.config, self.vault)
 
         # Access control - only allow configured users
@@ -75,9 +156,19 @@ class KnowledgeBot:
         # Key: user_id, Value: session data
         self.podcast_sessions = {}
 
+        # Pending text-input state per user (feedback/edit/email flows)
+        # One dict lookup decides dispatch in handle_message
+        self._user_state: dict[int, UserState] = {}
+
         # Power state - when False, only /poweron and /status work
         self.is_powered_on = True
 
+        # Pooled SMTP connection - reused across sends to amortize the
+        # TCP + TLS + AUTH handshake, refreshed every N messages
+        self._smtp_client: Optional["aiosmtplib.SMTP"] = None
+        self._smtp_lock = asyncio.Lock()
+        self._smtp_message_count = 0
+
     def _check_access(self, update: Update) -> bool:
         """Check if the user is authorized. Returns True if allowed."""
         user = update.effective_user
@@ -111,6 +202,24 @@ class KnowledgeBot:
             parse_mode="Markdown",
         )
 
+    def _get_state(self, user_id: int, mode: str) -> Optional[dict]:
+        """Get the payload for a user's pending state if it matches the mode."""
+        state = self._user_state.get(user_id)
+        if state is not None and state.mode == mode:
+            return state.payload
+        return None
+
+    def _clear_state(self, user_id: int, mode: Optional[str] = None) -> Optional[str]:
+        """Clear a user's pending state (optionally only a given mode).
+
+        Returns the cleared mode, or None if nothing was cleared.
+        """
+        state = self._user_state.get(user_id)
+        if state is None or (mode is not None and state.mode != mode):
+            return None
+        del self._user_state[user_id]
+        return state.mode
+
     def set_telegram_app(self, app: Application) -> None:
         """Set the Telegram app for sending digest messages."""
         self._telegram_app = app
@@ -219,7 +328,7 @@ class KnowledgeBot:
         url = context.args[0]
 
         # Validate URL for SSRF protection
-        is_valid, error = validate_url(url)
+        is_valid, error = await async_validate_url(url)
         if not is_valid:
             await update.message.reply_text(f"❌ Invalid URL: {error}")
             return ConversationHandler.END
@@ -357,10 +466,25 @@ class KnowledgeBot:
 
         return chunks
 
-    async def _send_long_message(self, chat_id: int, text: str, app: Application,
+    def _split_message_parts(self, parts: tuple[str, str, str], max_length: int = 4000) -> list[str]:
+        """Split a (header, body, footer) triple into chunks.
+
+        Avoids concatenating the full message up front - the body (often many
+        KB) is only copied once, into its final chunks.
+        """
+        header, body, footer = parts
+        if len(header) + len(body) + len(footer) <= max_length:
+            return [header + body + footer]
+
+        chunks = self._split_long_message(body, max_length - max(len(header), len(footer)))
+        chunks[0] = header + chunks[0]
+        chunks[-1] = chunks[-1] + footer
+        return chunks
+
+    async def _send_long_message(self, chat_id: int, text: str | tuple, app: Application,
                                   parse_mode: str = "Markdown", reply_markup=None) -> None:
         """Send a message via app.bot, splitting into chunks if too long."""
-        chunks = self._split_long_message(text)
+        chunks = self._split_message_parts(text) if isinstance(text, tuple) else self._split_long_message(text)
 
         for i, chunk in enumerate(chunks):
             is_last = (i == len(chunks) - 1)
@@ -371,10 +495,10 @@ class KnowledgeBot:
                 reply_markup=reply_markup if is_last else None,
             )
 
-    async def _reply_long_message(self, update: Update, text: str,
+    async def _reply_long_message(self, update: Update, text: str | tuple,
                                    parse_mode: str = "Markdown", reply_markup=None) -> None:
         """Send a reply message, splitting into chunks if too long."""
-        chunks = self._split_long_message(text)
+        chunks = self._split_message_parts(text) if isinstance(text, tuple) else self._split_long_message(text)
 
         for i, chunk in enumerate(chunks):
             is_last = (i == len(chunks) - 1)
@@ -407,8 +531,7 @@ class KnowledgeBot:
             return
 
         try:
-            from src.ai.summarizer import Summarizer
-            summarizer = Summarizer(self.config)
+            summarizer = self._summarizer
 
             email_content = await summarizer.generate_podcast_email(
                 transcript=session["transcript"],
@@ -421,15 +544,10 @@ class KnowledgeBot:
             session["draft_email"] = email_content
 
             # Send for review
-            keyboard = [
-                [InlineKeyboardButton("✅ Approve & Save", callback_data="podcast_approve")],
-                [InlineKeyboardButton("✏️ Provide Feedback", callback_data="podcast_feedback")],
-                [InlineKeyboardButton("❌ Cancel", callback_data="podcast_cancel")],
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = PODCAST_REVIEW_MARKUP
 
             # Use chunked sending for long messages
-            full_text = f"📧 **Draft Summary:**\n\n{email_content}\n\n─────────────────\nDoes this look good?"
+            full_text = ("📧 **Draft Summary:**\n\n", email_content, "\n\n─────────────────\nDoes this look good?")
             await self._send_long_message(chat_id, full_text, app, reply_markup=reply_markup)
 
         except Exception as e:
@@ -579,8 +697,7 @@ class KnowledgeBot:
         await update.message.reply_text("🤖 Generating summary with your insights... Please wait.")
 
         try:
-            from src.ai.summarizer import Summarizer
-            summarizer = Summarizer(self.config)
+            summarizer = self._summarizer
 
             email_content = await summarizer.generate_podcast_email(
                 transcript=session["transcript"],
@@ -593,14 +710,9 @@ class KnowledgeBot:
             session["draft_email"] = email_content
 
             # Send for review
-            keyboard = [
-                [InlineKeyboardButton("✅ Approve & Save", callback_data="podcast_approve")],
-                [InlineKeyboardButton("✏️ Provide Feedback", callback_data="podcast_feedback")],
-                [InlineKeyboardButton("❌ Cancel", callback_data="podcast_cancel")],
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = PODCAST_REVIEW_MARKUP
 
-            full_text = f"📧 **Draft Summary:**\n\n{email_content}\n\n─────────────────\nDoes this look good?"
+            full_text = ("📧 **Draft Summary:**\n\n", email_content, "\n\n─────────────────\nDoes this look good?")
             await self._reply_long_message(update, full_text, reply_markup=reply_markup)
             return PODCAST_REVIEW
 
@@ -711,9 +823,7 @@ class KnowledgeBot:
 
         elif query.data == "podcast_feedback":
             # Store that we're waiting for feedback
-            if not hasattr(self, '_feedback_state'):
-                self._feedback_state = {}
-            self._feedback_state[user_id] = True
+            self._user_state[user_id] = UserState(mode="feedback")
 
             await query.edit_message_text(
                 "📝 Please type your feedback or changes you'd like made.\n\n"
@@ -725,8 +835,7 @@ class KnowledgeBot:
             # Cancel the podcast session
             if user_id in self.podcast_sessions:
                 del self.podcast_sessions[user_id]
-            if hasattr(self, '_feedback_state') and user_id in self._feedback_state:
-                del self._feedback_state[user_id]
+            self._clear_state(user_id, "feedback")
             await query.edit_message_reply_markup(reply_markup=None)
             await query.message.reply_text("❌ Podcast session cancelled.")
             return ConversationHandler.END if in_conversation else None
@@ -746,8 +855,7 @@ class KnowledgeBot:
         await update.message.reply_text("🔄 Regenerating with your feedback...")
 
         try:
-            from src.ai.summarizer import Summarizer
-            summarizer = Summarizer(self.config)
+            summarizer = self._summarizer
 
             # Record feedback for learning
             self.learning.record_feedback(
@@ -772,14 +880,9 @@ class KnowledgeBot:
             session["draft_email"] = email_content
 
             # Send for review again
-            keyboard = [
-                [InlineKeyboardButton("✅ Approve & Save", callback_data="podcast_approve")],
-                [InlineKeyboardButton("✏️ More Feedback", callback_data="podcast_feedback")],
-                [InlineKeyboardButton("❌ Cancel", callback_data="podcast_cancel")],
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = PODCAST_REGEN_MARKUP
 
-            full_text = f"📧 **Updated Draft:**\n\n{email_content}\n\n─────────────────\nDoes this look good now?"
+            full_text = ("📧 **Updated Draft:**\n\n", email_content, "\n\n─────────────────\nDoes this look good now?")
             await self._reply_long_message(update, full_text, reply_markup=reply_markup)
             return PODCAST_REVIEW
 
@@ -818,8 +921,7 @@ class KnowledgeBot:
     ) -> str:
         """Categorize a newly saved summary. Returns a status message."""
         try:
-            from src.ai.summarizer import Summarizer
-            summarizer = Summarizer(self.config)
+            summarizer = self._summarizer
 
             folder_tree = self.category_storage.list_tree()
             result = await summarizer.categorize_summary(
@@ -922,8 +1024,7 @@ class KnowledgeBot:
     async def _trigger_reorganization(self) -> str:
         """Trigger AI-powered folder reorganization. Returns user-facing message."""
         try:
-            from src.ai.summarizer import Summarizer
-            summarizer = Summarizer(self.config)
+            summarizer = self._summarizer
 
             folder_tree = self.category_storage.list_tree()
 
@@ -988,20 +1089,12 @@ class KnowledgeBot:
             del self.podcast_sessions[user_id]
             cancelled.append("Podcast processing")
 
-        # Clear feedback state
-        if hasattr(self, '_feedback_state') and user_id in self._feedback_state:
-            del self._feedback_state[user_id]
-            cancelled.append("Feedback mode")
-
-        # Clear edit state
-        if hasattr(self, '_edit_state') and user_id in self._edit_state:
-            del self._edit_state[user_id]
-            cancelled.append("Edit mode")
-
-        # Clear email state
-        if hasattr(self, '_email_state') and user_id in self._email_state:
-            del self._email_state[user_id]
-            cancelled.append("Email mode")
+        # Clear any pending text-input state (feedback/edit/email)
+        cleared_mode = self._clear_state(user_id)
+        if cleared_mode:
+            cancelled.append(
+                {"feedback": "Feedback mode", "edit": "Edit mode", "email": "Email mode"}[cleared_mode]
+            )
 
         # Clear lookup state
         if hasattr(self, '_lookup_state') and user_id in self._lookup_state:
@@ -1042,7 +1135,7 @@ class KnowledgeBot:
         url = context.args[0]
 
         # Validate URL for SSRF protection
-        is_valid, error = validate_url(url)
+        is_valid, error = await async_validate_url(url)
         if not is_valid:
             await update.message.reply_text(f"❌ Invalid URL: {error}")
             return
@@ -1079,7 +1172,7 @@ class KnowledgeBot:
         url = context.args[0]
 
         # Validate URL for SSRF protection
-        is_valid, error = validate_url(url)
+        is_valid, error = await async_validate_url(url)
         if not is_valid:
             await update.message.reply_text(f"❌ Invalid URL: {error}")
             return
@@ -1217,20 +1310,12 @@ class KnowledgeBot:
             del self.podcast_sessions[user_id]
             cancelled.append(f"Podcast session: {title}")
 
-        # Clear feedback state
-        if hasattr(self, '_feedback_state') and user_id in self._feedback_state:
-            del self._feedback_state[user_id]
-            cancelled.append("Feedback input mode")
-
-        # Clear edit state
-        if hasattr(self, '_edit_state') and user_id in self._edit_state:
-            del self._edit_state[user_id]
-            cancelled.append("Edit mode")
-
-        # Clear email state
-        if hasattr(self, '_email_state') and user_id in self._email_state:
-            del self._email_state[user_id]
-            cancelled.append("Email input mode")
+        # Clear any pending text-input state (feedback/edit/email)
+        cleared_mode = self._clear_state(user_id)
+        if cleared_mode:
+            cancelled.append(
+                {"feedback": "Feedback input mode", "edit": "Edit mode", "email": "Email input mode"}[cleared_mode]
+            )
 
         # Clear lookup state
         if hasattr(self, '_lookup_state') and user_id in self._lookup_state:
@@ -1481,14 +1566,13 @@ class KnowledgeBot:
 
         show_info = f" from **{item.show}**" if item.show else ""
         date_str = item.created_at[:10] if item.created_at else ""
-        full_text = (
+        header = (
             f"📧 **{item.title}**{show_info}\n"
             f"📅 {date_str}\n"
             f"{cat_info}"
             f"\n─────────────────\n\n"
-            f"{item.email_content}"
         )
-        await self._reply_long_message(update, full_text, reply_markup=reply_markup)
+        await self._reply_long_message(update, (header, item.email_content, ""), reply_markup=reply_markup)
 
     async def _show_folder_contents(self, update: Update, category_id: str, page: int = 0) -> None:
         """Show contents of a folder with pagination."""
@@ -1608,8 +1692,7 @@ class KnowledgeBot:
         await update.message.reply_text("🔍 Searching...")
 
         try:
-            from src.ai.summarizer import Summarizer
-            summarizer = Summarizer(self.config)
+            summarizer = self._summarizer
 
             summary_list = [
                 {
@@ -1679,9 +1762,7 @@ class KnowledgeBot:
         elif query.data == "saved_edit":
             if saved_info:
                 # Store edit state for this user
-                if not hasattr(self, '_edit_state'):
-                    self._edit_state = {}
-                self._edit_state[user_id] = saved_info
+                self._user_state[user_id] = UserState(mode="edit", payload=saved_info)
 
                 await query.edit_message_reply_markup(reply_markup=None)
                 await query.message.reply_text(
@@ -1774,9 +1855,7 @@ class KnowledgeBot:
 
             if saved_info:
                 # Store that we're waiting for email address
-                if not hasattr(self, '_email_state'):
-                    self._email_state = {}
-                self._email_state[user_id] = saved_info
+                self._user_state[user_id] = UserState(mode="email", payload=saved_info)
 
                 await query.edit_message_reply_markup(reply_markup=None)
 
@@ -1820,7 +1899,7 @@ class KnowledgeBot:
                 await query.message.reply_text("❌ No saved email found.")
                 return
 
-            saved_info = self._email_state.get(user_id) if hasattr(self, '_email_state') else None
+            saved_info = self._get_state(user_id, "email")
             if not saved_info:
                 await query.message.reply_text("❌ Session expired. Please try again.")
                 return
@@ -1837,8 +1916,7 @@ class KnowledgeBot:
                     await query.edit_message_text("❌ Failed to send email. Check your email configuration.")
 
             # Clean up state
-            if hasattr(self, '_email_state') and user_id in self._email_state:
-                del self._email_state[user_id]
+            self._clear_state(user_id, "email")
 
         elif query.data == "email_enter_new":
             # User wants to enter a different email
@@ -1856,8 +1934,7 @@ class KnowledgeBot:
             )
 
         elif query.data == "email_cancel":
-            if hasattr(self, '_email_state') and user_id in self._email_state:
-                del self._email_state[user_id]
+            self._clear_state(user_id, "email")
             await query.edit_message_text("📧 Email cancelled.")
 
     def _markdown_to_html(self, text: str) -> str:
@@ -1867,26 +1944,22 @@ class KnowledgeBot:
         # Escape HTML entities first
         text = html_lib.escape(text)
 
-        # Convert markdown to HTML
+        # Convert markdown to HTML - skip the regex passes entirely when the
+        # marker characters aren't present (common for short status bodies)
         # Bold: **text** -> <strong>text</strong>
-        text = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', text)
+        if '**' in text:
+            text = _BOLD_RE.sub(r'<strong>\1</strong>', text)
 
         # Italic: _text_ -> <em>text</em> (but not in the middle of words)
-        text = re.sub(r'(?<![a-zA-Z])_([^_]+)_(?![a-zA-Z])', r'<em>\1</em>', text)
+        if '_' in text:
+            text = _ITALIC_RE.sub(r'<em>\1</em>', text)
 
         # Line breaks
         text = text.replace('\n\n', '</p><p>')
         text = text.replace('\n', '<br>')
 
-        # Wrap in paragraphs and add email styling
-        html = f"""
-        <html>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <p>{text}</p>
-        </body>
-        </html>
-        """
-        return html
+        # Wrap in the precomputed shell (paragraphs + email styling)
+        return _HTML_SHELL_PREFIX + text + _HTML_SHELL_SUFFIX
 
     async def _send_email(self, to_email: str, subject: str, body: str) -> bool:
         """Send an email with the podcast summary.
@@ -1928,49 +2001,103 @@ class KnowledgeBot:
         return True
 
     async def _send_email_smtp(self, to_email: str, subject: str, text_body: str, html_body: str) -> bool:
-        """Send email via SMTP."""
-        msg = MIMEMultipart('alternative')
+        """Send email via SMTP (async, so sending doesn't block other updates)."""
+        # Lazy import - most sessions never send email, and deferring the
+        # email machinery shaves bot cold-start time
+        from email.message import EmailMessage
+
+        msg = EmailMessage()
         msg['Subject'] = subject
         msg['From'] = self.config.email.sender_email
         msg['To'] = to_email
 
-        # Plain text version (fallback)
-        text_part = MIMEText(text_body, 'plain')
-        msg.attach(text_part)
+        # Plain text version (fallback) + HTML alternative (preferred)
+        msg.set_content(text_body)
+        msg.add_alternative(html_body, subtype='html')
 
-        # HTML version (preferred)
-        html_part = MIMEText(html_body, 'html')
-        msg.attach(html_part)
+        import aiosmtplib
 
-        # Connect and send
-        with smtplib.SMTP(self.config.email.smtp_server, self.config.email.smtp_port) as server:
-            server.starttls()
-            server.login(self.config.email.sender_email, self.config.email.sender_password)
-            server.sendmail(self.config.email.sender_email, to_email, msg.as_string())
+        # Send over the pooled connection - send_message streams the MIME
+        # body in chunks instead of materializing it with as_string()
+        async with self._smtp_lock:
+            server = await self._get_smtp_client()
+            try:
+                await server.send_message(msg)
+            except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPResponseException) as e:
+                # Servers drop idle connections; is_connected only sees
+                # the local transport. Reconnect and retry once.
+                logger.debug(f"Pooled SMTP connection stale ({e}), reconnecting")
+                await self._close_smtp_client()
+                server = await self._get_smtp_client()
+                await server.send_message(msg)
+            self._smtp_message_count += 1
+            if self._smtp_message_count >= self._SMTP_MAX_MESSAGES:
+                await self._close_smtp_client()
 
         return True
 
+    # Refresh the pooled SMTP connection after this many messages
+    _SMTP_MAX_MESSAGES = 50
+
+    async def _get_smtp_client(self) -> "aiosmtplib.SMTP":
+        """Get the pooled SMTP client, connecting lazily. Caller must hold _smtp_lock."""
+        if self._smtp_client is not None and self._smtp_client.is_connected:
+            return self._smtp_client
+
+        import aiosmtplib
+
+        client = aiosmtplib.SMTP(
+            hostname=self.config.email.smtp_server,
+            port=self.config.email.smtp_port,
+            start_tls=False,
+            use_tls=False,
+        )
+        await client.connect()
+        await client.starttls()
+        await client.login(self.config.email.sender_email, self.config.email.sender_password)
+        self._smtp_client = client
+        self._smtp_message_count = 0
+        return client
+
+    async def _close_smtp_client(self) -> None:
+        """Close the pooled SMTP connection if open. Caller must hold _smtp_lock."""
+        if self._smtp_client is not None:
+            try:
+                await self._smtp_client.quit()
+            except Exception as e:
+                logger.debug(f"Error closing SMTP connection: {e}")
+            self._smtp_client = None
+            self._smtp_message_count = 0
+
+    async def close_smtp_pool(self) -> None:
+        """Close the pooled SMTP connection (called on shutdown)."""
+        async with self._smtp_lock:
+            await self._close_smtp_client()
+
     async def _handle_podcast_feedback_input(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
         """Handle podcast feedback input (standalone mode). Returns True if handled."""
         user_id = update.effective_user.id
+        msg = update.message
 
         # Check if user is in feedback mode
-        if not hasattr(self, '_feedback_state') or user_id not in self._feedback_state:
+        if self._get_state(user_id, "feedback") is None:
             return False
 
         # Check if they have an active podcast session
         session = self.podcast_sessions.get(user_id)
         if not session:
-            del self._feedback_state[user_id]
+            self._clear_state(user_id, "feedback")
             return False
 
         # Process the feedback
-        feedback = update.message.text
-        await update.message.reply_text("🔄 Regenerating with your feedback...")
+        feedback = msg.text
+        # Overlap the status notification with the (much longer) LLM call
+        notify = asyncio.create_task(
+            msg.reply_text("🔄 Regenerating with your feedback...")
+        )
 
         try:
-            from src.ai.summarizer import Summarizer
-            summarizer = Summarizer(self.config)
+            summarizer = self._summarizer
 
             # Record feedback for learning
             self.learning.record_feedback(
@@ -1992,64 +2119,61 @@ class KnowledgeBot:
                 learned_preferences=self.learning.get_prompt_context(),
             )
 
+            await notify
             session["draft_email"] = email_content
 
             # Send for review again
-            keyboard = [
-                [InlineKeyboardButton("✅ Approve & Save", callback_data="podcast_approve")],
-                [InlineKeyboardButton("✏️ More Feedback", callback_data="podcast_feedback")],
-                [InlineKeyboardButton("❌ Cancel", callback_data="podcast_cancel")],
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = PODCAST_REGEN_MARKUP
 
-            full_text = f"📧 **Updated Draft:**\n\n{email_content}\n\n─────────────────\nDoes this look good now?"
+            full_text = ("📧 **Updated Draft:**\n\n", email_content, "\n\n─────────────────\nDoes this look good now?")
             await self._reply_long_message(update, full_text, reply_markup=reply_markup)
 
             # Clear feedback state
-            del self._feedback_state[user_id]
+            self._clear_state(user_id, "feedback")
 
         except Exception as e:
             logger.exception("Error regenerating summary")
-            await update.message.reply_text(f"❌ Error: {sanitize_error_message(e)}")
-            del self._feedback_state[user_id]
+            await msg.reply_text(f"❌ Error: {sanitize_error_message(e)}")
+            self._clear_state(user_id, "feedback")
 
         return True
 
     async def _handle_edit_input(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
         """Handle edit feedback input. Returns True if handled."""
         user_id = update.effective_user.id
-        if not hasattr(self, '_edit_state') or user_id not in self._edit_state:
+        msg = update.message
+        edit_info = self._get_state(user_id, "edit")
+        if edit_info is None:
             return False
 
-        text = update.message.text.strip()
+        text = msg.text.strip()
 
         # Check for cancel
         if text.lower() == '/cancel':
-            del self._edit_state[user_id]
-            await update.message.reply_text("✏️ Edit cancelled.")
+            self._clear_state(user_id, "edit")
+            await msg.reply_text("✏️ Edit cancelled.")
             return True
 
-        edit_info = self._edit_state[user_id]
-
         # Get the current summary and transcript from storage
         summary_obj = self.summary_storage.get_summary(edit_info['id']) if 'id' in edit_info else None
 
         if not summary_obj:
-            await update.message.reply_text("❌ Could not read the summary.")
-            del self._edit_state[user_id]
+            await msg.reply_text("❌ Could not read the summary.")
+            self._clear_state(user_id, "edit")
             return True
 
         current_summary = summary_obj.email_content
         transcript = summary_obj.transcript
 
-        await update.message.reply_text("🔄 Regenerating with your feedback...")
+        # Overlap the status notification with the (much longer) LLM call
+        notify = asyncio.create_task(
+            msg.reply_text("🔄 Regenerating with your feedback...")
+        )
 
         try:
-            from src.ai.summarizer import Summarizer
-            summarizer = Summarizer(self.config)
+            summarizer = self._summarizer
 
             # Create a minimal metadata object
-            from src.storage.vault import PodcastMetadata
             metadata = PodcastMetadata(
                 title=edit_info['title'],
                 show_name=edit_info.get('show'),
@@ -2072,25 +2196,21 @@ class KnowledgeBot:
                 previous_draft=current_summary,
                 learned_preferences=self.learning.get_prompt_context(),
             )
+            await notify
 
             # Show preview with approve/more feedback options
-            keyboard = [
-                [InlineKeyboardButton("✅ Save Changes", callback_data="edit_save")],
-                [InlineKeyboardButton("✏️ More Feedback", callback_data="edit_more")],
-                [InlineKeyboardButton("❌ Cancel", callback_data="edit_cancel")],
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = EDIT_REVIEW_MARKUP
 
             # Store the new summary for saving
             edit_info['new_summary'] = new_summary
 
-            full_text = f"📧 **Updated Email:**\n\n{new_summary}\n\n─────────────────\nLook good?"
+            full_text = ("📧 **Updated Email:**\n\n", new_summary, "\n\n─────────────────\nLook good?")
             await self._reply_long_message(update, full_text, reply_markup=reply_markup)
 
         except Exception as e:
             logger.exception("Error regenerating summary")
-            await update.message.reply_text(f"❌ Error: {sanitize_error_message(e)}")
-            del self._edit_state[user_id]
+            await msg.reply_text(f"❌ Error: {sanitize_error_message(e)}")
+            self._clear_state(user_id, "edit")
 
         return True
 
@@ -2100,18 +2220,21 @@ class KnowledgeBot:
         await query.answer()
 
         user_id = update.effective_user.id
-        edit_info = self._edit_state.get(user_id) if hasattr(self, '_edit_state') else None
+        edit_info = self._get_state(user_id, "edit")
 
         if query.data == "edit_save":
             if edit_info and 'new_summary' in edit_info and 'id' in edit_info:
-                # Save the updated summary to storage
-                success = self.summary_storage.update_summary(edit_info['id'], edit_info['new_summary'])
+                # Overlap the storage write with the Telegram edit round trip
+                storage_task = asyncio.create_task(
+                    asyncio.to_thread(self.summary_storage.update_summary, edit_info['id'], edit_info['new_summary'])
+                )
                 await query.edit_message_reply_markup(reply_markup=None)
+                success = await storage_task
                 if success:
                     await query.message.reply_text("✅ **Changes saved!**\n\nUse `/lookup` to view your updated summary.")
                 else:
                     await query.message.reply_text("❌ Failed to save changes.")
-                del self._edit_state[user_id]
+                self._clear_state(user_id, "edit")
             else:
                 await query.message.reply_text("❌ No changes to save.")
 
@@ -2124,8 +2247,7 @@ class KnowledgeBot:
             )
 
         elif query.data == "edit_cancel":
-            if hasattr(self, '_edit_state') and user_id in self._edit_state:
-                del self._edit_state[user_id]
+            self._clear_state(user_id, "edit")
             await query.edit_message_reply_markup(reply_markup=None)
             await query.message.reply_text("❌ Changes discarded.")
 
@@ -2471,37 +2593,35 @@ class KnowledgeBot:
     async def _handle_email_input(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
         """Handle email address input. Returns True if handled."""
         user_id = update.effective_user.id
-        if not hasattr(self, '_email_state') or user_id not in self._email_state:
+        msg = update.message
+        saved_info = self._get_state(user_id, "email")
+        if saved_info is None:
             return False
 
-        text = update.message.text.strip()
+        text = msg.text.strip()
 
         # Check for cancel
         if text.lower() == '/cancel':
-            del self._email_state[user_id]
-            await update.message.reply_text("📧 Email cancelled.")
+            self._clear_state(user_id, "email")
+            await msg.reply_text("📧 Email cancelled.")
             return True
 
         # Validate email address
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, text):
-            await update.message.reply_text(
+        if not EMAIL_RE.match(text):
+            await msg.reply_text(
                 "❌ Invalid email address. Please enter a valid email or `/cancel` to go back.",
                 parse_mode="Markdown",
             )
             return True
 
-        # Get the summary info
-        saved_info = self._email_state[user_id]
-
         # Get summary from storage
         summary_obj = self.summary_storage.get_summary(saved_info['id']) if 'id' in saved_info else None
         if not summary_obj:
-            await update.message.reply_text("❌ Could not read the summary.")
-            del self._email_state[user_id]
+            await msg.reply_text("❌ Could not read the summary.")
+            self._clear_state(user_id, "email")
             return True
 
-        await update.message.reply_text("📧 Sending email...")
+        await msg.reply_text("📧 Sending email...")
 
         # Send the email
         show_info = f" ({saved_info['show']})" if saved_info.get('show') else ""
@@ -2512,21 +2632,29 @@ class KnowledgeBot:
         if success:
             # Save the email for future quick sends
             self.learning.set_default_email(text)
-            await update.message.reply_text(
+            await msg.reply_text(
                 f"✅ Email sent to `{text}`!\n\n"
                 "_Your email has been saved for quick sending next time._",
                 parse_mode="Markdown",
             )
         else:
-            await update.message.reply_text(
+            await msg.reply_text(
                 "❌ Failed to send email. Check your email configuration in `config.yaml`.",
                 parse_mode="Markdown",
             )
 
         # Clean up
-        del self._email_state[user_id]
+        self._clear_state(user_id, "email")
         return True
 
+    # Dispatch table for pending text-input modes - one dict lookup replaces
+    # three sequential handler calls (values are unbound; call with self)
+    _STATE_HANDLERS = {
+        "feedback": _handle_podcast_feedback_input,
+        "edit": _handle_edit_input,
+        "email": _handle_email_input,
+    }
+
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle text messages - for lookup selection and podcast links."""
         if not self._check_access(update):
@@ -2534,17 +2662,11 @@ class KnowledgeBot:
 
         message = update.message
         text = message.text or message.caption or ""
+        user_id = update.effective_user.id
 
-        # Check for podcast feedback input (standalone mode)
-        if await self._handle_podcast_feedback_input(update, context):
-            return
-
-        # Check for edit input first
-        if await self._handle_edit_input(update, context):
-            return
-
-        # Check for email input
-        if await self._handle_email_input(update, context):
+        # Check for pending text-input state (feedback/edit/email)
+        state = self._user_state.get(user_id)
+        if state is not None and await self._STATE_HANDLERS[state.mode](self, update, context):
             return
 
         # Check for folder action input (new subfolder, rename)
@@ -2552,32 +2674,31 @@ class KnowledgeBot:
             return
 
         # Check for lookup selection
-        user_id = update.effective_user.id
         if hasattr(self, '_lookup_state') and user_id in self._lookup_state:
             await self.lookup_selection(update, context)
             return
 
         # Check for podcast URLs in the message
-        url_pattern = r"https?://[^\s]+"
-        urls = re.findall(url_pattern, text)
+        urls = URL_RE.findall(text)
 
         if urls:
             url = urls[0]
 
             # Validate URL for SSRF protection
-            is_valid, error = validate_url(url)
+            is_valid, error = await async_validate_url(url)
             if not is_valid:
-                await update.message.reply_text(f"❌ Invalid URL: {error}")
+                await message.reply_text(f"❌ Invalid URL: {error}")
                 return
 
-            # Only process podcast links
-            if "spotify.com" in url or "podcasts.apple.com" in url:
-                await update.message.reply_text("🎙️ Detected podcast link. Processing...")
+            # Only process podcast links (single parse + tuple suffix check)
+            host = urlsplit(url).hostname or ""
+            if host.endswith(_PODCAST_HOSTS):
+                await message.reply_text("🎙️ Detected podcast link. Processing...")
                 # Create mock context with args
                 mock_context = type("Context", (), {"args": [url]})()
                 await self.podcast_command(update, mock_context)
             else:
-                await update.message.reply_text(
+                await message.reply_text(
                     "📝 Note: Currently I only process podcast links.\n"
                     "Use `/podcast <url>` for Spotify or Apple Podcasts links."
                 )
@@ -2586,13 +2707,13 @@ class KnowledgeBot:
             if text and update.message.forward_date:  # Only save forwarded messages as notes
                 try:
                     result = self.vault.save_note(text, source="forwarded")
-                    await update.message.reply_text(
+                    await message.reply_text(
                         f"📝 Forwarded message saved as note!\n" f"Saved to: `{result}`",
                         parse_mode="Markdown",
                     )
                 except Exception as e:
                     logger.exception("Error saving forwarded note")
-                    await update.message.reply_text(f"❌ Error: {sanitize_error_message(e)}")
+                    await message.reply_text(f"❌ Error: {sanitize_error_message(e)}")
 
 
 def main():
@@ -2615,8 +2736,14 @@ def main():
     # Create bot instance
     bot = KnowledgeBot()
 
-    # Build application
-    application = Application.builder().token(config.telegram.bot_token).build()
+    # Build application - HTTP/2 multiplexing + orjson response decoding
+    application = (
+        Application.builder()
+        .token(config.telegram.bot_token)
+        .request(ORJSONRequest(http_version="2"))
+        .get_updates_request(ORJSONRequest(http_version="2"))
+        .build()
+    )
 
     # Link bot to application for digest messages
     bot.set_telegram_app(application)
@@ -2626,7 +2753,7 @@ def main():
         entry_points=[CommandHandler("podcast", bot.podcast_command)],
         states={
             PODCAST_MODE_SELECT: [
-                CallbackQueryHandler(bot.podcast_mode_callback, pattern="^podcast_mode_"),
+                CallbackQueryHandler(bot.podcast_mode_callback, pattern=_PODCAST_MODE_CALLBACKS.__contains__),
             ],
             PODCAST_INTERACTIVE: [
                 CommandHandler("detail", bot.podcast_detail_command),
@@ -2635,7 +2762,7 @@ def main():
                 CommandHandler("cancel", bot.podcast_cancel),
             ],
             PODCAST_REVIEW: [
-                CallbackQueryHandler(bot.podcast_review_callback, pattern="^podcast_"),
+                CallbackQueryHandler(bot.podcast_review_callback, pattern=_PODCAST_REVIEW_CALLBACKS.__contains__),
                 MessageHandler(filters.TEXT & ~filters.COMMAND, bot.podcast_feedback_text),
             ],
             ConversationHandler.TIMEOUT: [
@@ -2648,43 +2775,36 @@ def main():
         conversation_timeout=600,  # 10 minute timeout to prevent stuck states
     )
 
-    # Add handlers
-    application.add_handler(CommandHandler("start", bot.start))
-    application.add_handler(CommandHandler("help", bot.help_command))
-    application.add_handler(CommandHandler("stats", bot.stats_command))
-    application.add_handler(CommandHandler("cancel", bot.cancel_command))
-    application.add_handler(podcast_conv_handler)
-    application.add_handler(CommandHandler("lookup", bot.lookup_command))
-    application.add_handler(CommandHandler("organize", bot.organize_command))
-    application.add_handler(CommandHandler("status", bot.status_command))
-    application.add_handler(CommandHandler("stop", bot.stop_command))
-    application.add_handler(CommandHandler("poweron", bot.poweron_command))
-    application.add_handler(CommandHandler("poweroff", bot.poweroff_command))
-    application.add_handler(CommandHandler("digest", bot.digest_command))
-
-    # Handle podcast approve/feedback callbacks (standalone, outside ConversationHandler)
-    # This catches callbacks from AI-only mode where the conversation has ended
-    application.add_handler(CallbackQueryHandler(bot.podcast_review_standalone, pattern="^podcast_(approve|feedback|cancel)$"))
-
-    # Handle saved summary actions (edit, email, back, done)
-    application.add_handler(CallbackQueryHandler(bot.saved_action_callback, pattern="^saved_"))
-
-    # Handle edit actions (save, more feedback, cancel)
-    application.add_handler(CallbackQueryHandler(bot.edit_action_callback, pattern="^edit_"))
-
-    # Handle email quick-send callbacks
-    application.add_handler(CallbackQueryHandler(bot.saved_action_callback, pattern="^email_"))
-
-    # Handle folder management actions (new, rename, move, delete, pagination)
-    application.add_handler(CallbackQueryHandler(bot.folder_action_callback, pattern="^folder_"))
-
-    # Handle summary move to folder
-    application.add_handler(CallbackQueryHandler(bot.folder_action_callback, pattern="^summary_move"))
-
-    # Handle text messages (for lookup selection, email input, podcast links, and forwarded notes)
-    application.add_handler(
-        MessageHandler(filters.TEXT & ~filters.COMMAND, bot.handle_message)
-    )
+    # Add handlers - registration order matters: the conversation handler must
+    # see podcast callbacks before the standalone review handler, and the text
+    # message handler must come last
+    handlers = [
+        CommandHandler("start", bot.start),
+        CommandHandler("help", bot.help_command),
+        CommandHandler("stats", bot.stats_command),
+        CommandHandler("cancel", bot.cancel_command),
+        podcast_conv_handler,
+        CommandHandler("lookup", bot.lookup_command),
+        CommandHandler("organize", bot.organize_command),
+        CommandHandler("status", bot.status_command),
+        CommandHandler("stop", bot.stop_command),
+        CommandHandler("poweron", bot.poweron_command),
+        CommandHandler("poweroff", bot.poweroff_command),
+        CommandHandler("digest", bot.digest_command),
+        # Podcast approve/feedback callbacks (standalone, outside ConversationHandler)
+        # This catches callbacks from AI-only mode where the conversation has ended
+        CallbackQueryHandler(bot.podcast_review_standalone, pattern=_PODCAST_REVIEW_CALLBACKS.__contains__),
+        # Saved summary actions (edit, email, back, done) + email quick-send callbacks
+        CallbackQueryHandler(bot.saved_action_callback, pattern=_SAVED_CALLBACKS.__contains__),
+        # Edit actions (save, more feedback, cancel)
+        CallbackQueryHandler(bot.edit_action_callback, pattern=_EDIT_CALLBACKS.__contains__),
+        # Folder management (new, rename, move, delete, pagination) + summary move
+        CallbackQueryHandler(bot.folder_action_callback, pattern=_is_folder_callback),
+        # Text messages (lookup selection, email input, podcast links, forwarded notes)
+        MessageHandler(filters.TEXT & ~filters.COMMAND, bot.handle_message),
+    ]
+    for handler in handlers:
+        application.add_handler(handler)
 
     # Use post_init to start scheduler after event loop is running
     async def post_init(app: Application) -> None:
@@ -2692,6 +2812,12 @@ def main():
 
     async def post_shutdown(app: Application) -> None:
         bot.stop_scheduler()
+        bot.category_storage.flush()
+        await bot.close_smtp_pool()
+        await bot.article_processor.aclose()
+        await bot.thread_processor.aclose()
+        await bot.podcast_processor.aclose()
+        bot.podcast_processor.unload_whisper_model()
 
     application.post_init = post_init
     application.post_shutdown = post_shutdown
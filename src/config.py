@@ -1,31 +1,53 @@
 """Configuration management for Knowledge Bot."""
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Literal
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Use the C-accelerated YAML parser when libyaml is available (~10x faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_raw(path: str, mtime: float) -> dict:
+    """Parse the YAML config file, memoized on (path, mtime).
+
+    Repeated init_config calls skip re-parsing as long as the file
+    hasn't changed on disk.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 class TelegramConfig(BaseModel):
     """Telegram bot configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     bot_token: str
-    # List of Telegram user IDs allowed to use the bot
+    # Telegram user IDs allowed to use the bot (frozenset for O(1) membership)
     # Get your user ID by messaging @userinfobot on Telegram
-    allowed_users: list[int] = Field(default_factory=list)
+    allowed_users: frozenset[int] = Field(default_factory=frozenset)
 
 
 class ObsidianConfig(BaseModel):
     """Obsidian vault configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     vault_path: Path
 
 
 class AIConfig(BaseModel):
     """AI/Claude configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     anthropic_api_key: str
     model: str = "claude-sonnet-4-20250514"
 
@@ -33,12 +55,31 @@ class AIConfig(BaseModel):
 class WhisperConfig(BaseModel):
     """Whisper transcription configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     # Mode: "local" for faster-whisper, "cloud" for OpenAI/Groq Whisper API
     mode: Literal["local", "cloud"] = "local"
 
     # Local mode settings
     model_size: Literal["tiny", "base", "small", "medium", "large-v3"] = "base"
     device: str = "auto"
+    # Quantization for local mode; "auto" lets CTranslate2 pick the fastest
+    # type the hardware actually supports (e.g. int8_float16 on tensor cores)
+    compute_type: Literal["auto", "float16", "int8_float16", "int8"] = "auto"
+    # Seconds of inactivity before the local model is unloaded from memory
+    idle_unload_seconds: int = 600
+    # Segments batched through the encoder per step in local mode
+    batch_size: int = 8
+
+    # Playback speedup applied before cloud upload. Whisper tolerates
+    # 2x speech with negligible accuracy loss, and the APIs bill per
+    # audio-minute, so this halves both cost and latency. Set to 1.0 to
+    # upload at the original rate. Local mode ignores it.
+    speedup_factor: float = 2.0
+
+    # Concurrent cloud transcription requests (long episodes are split
+    # into chunks and transcribed in parallel up to this bound)
+    max_parallel: int = 4
 
     # Cloud mode settings
     openai_api_key: str = ""
@@ -48,6 +89,8 @@ class WhisperConfig(BaseModel):
 class DigestConfig(BaseModel):
     """Daily digest configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     time: str = "20:00"
     timezone: str = "America/Los_Angeles"
 
@@ -55,6 +98,8 @@ class DigestConfig(BaseModel):
 class SpotifyConfig(BaseModel):
     """Optional Spotify configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     client_id: str = ""
     client_secret: str = ""
 
@@ -67,6 +112,8 @@ class EmailConfig(BaseModel):
     - smtp: Traditional SMTP (Gmail, etc.)
     """
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     enabled: bool = False
     provider: Literal["resend", "smtp"] = "resend"
 
@@ -81,6 +128,10 @@ class EmailConfig(BaseModel):
     sender_password: str = ""
 
 
+# Validates comma-split user IDs in pydantic-core (handles whitespace + int coercion)
+_USERS_ADAPTER = TypeAdapter(list[int])
+
+
 def _get_groq_key() -> str:
     """Get Groq API key from environment variables."""
     # Primary: dedicated GROQ_API_KEY env var
@@ -103,6 +154,8 @@ def _get_groq_key() -> str:
 class Config(BaseModel):
     """Main configuration container."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     telegram: TelegramConfig
     obsidian: ObsidianConfig
     ai: AIConfig
@@ -132,13 +185,15 @@ class Config(BaseModel):
         config_path = Path(config_path)
 
         if config_path.exists():
-            with open(config_path) as f:
-                data = yaml.safe_load(f)
+            # Deep-copy so the env var overrides below never mutate the cache
+            data = copy.deepcopy(_load_raw(str(config_path), config_path.stat().st_mtime))
         elif os.environ.get("TELEGRAM_BOT_TOKEN"):
             # Build config entirely from environment variables
             allowed_users = []
             if os.environ.get("TELEGRAM_ALLOWED_USERS"):
-                allowed_users = [int(x.strip()) for x in os.environ["TELEGRAM_ALLOWED_USERS"].split(",")]
+                allowed_users = _USERS_ADAPTER.validate_python(
+                    os.environ["TELEGRAM_ALLOWED_USERS"].split(",")
+                )
 
             data = {
                 "telegram": {
@@ -1,7 +1,8 @@
 """Daily digest generation and scheduling."""
 
 import logging
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Callable, Optional
 from zoneinfo import ZoneInfo
@@ -9,13 +10,25 @@ from zoneinfo import ZoneInfo
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from src.ai.summarizer import Summarizer
+from src.ai.summarizer import Summarizer, get_summarizer
 from src.config import Config
 from src.storage.vault import VaultWriter
 from src.storage.vectors import VectorStore
 
 logger = logging.getLogger(__name__)
 
+# How long after the scheduled time a missed run is still worth firing
+_CATCHUP_GRACE = 3600  # seconds
+
+# Emoji per content type for digest formatting
+_TYPE_EMOJI = {
+    "podcast": "🎙️",
+    "article": "📰",
+    "thread": "🧵",
+    "note": "📝",
+    "insight": "💡",
+}
+
 
 class DailyDigest:
     """Handles daily digest generation and delivery."""
@@ -33,11 +46,17 @@ class DailyDigest:
         self.send_telegram_message = send_telegram_message
         self._summarizer = None
         self._scheduler = None
+        # Timezone is fixed for the process lifetime; build it once
+        self._tz = ZoneInfo(config.digest.timezone)
+        # Date of the last digest run, for missed-run catch-up across
+        # restarts (the jobstore itself is in-memory: bound methods
+        # can't be pickled into a persistent one)
+        self._state_path = config.obsidian.vault_path / ".last_digest"
 
     def _get_summarizer(self) -> Summarizer:
         """Lazy load summarizer."""
         if self._summarizer is None:
-            self._summarizer = Summarizer(self.config)
+            self._summarizer = get_summarizer(self.config)
         return self._summarizer
 
     def start_scheduler(self) -> None:
@@ -45,16 +64,21 @@ class DailyDigest:
         if self._scheduler is not None:
             return
 
-        self._scheduler = AsyncIOScheduler()
+        self._scheduler = AsyncIOScheduler(
+            job_defaults={
+                "coalesce": True,
+                "misfire_grace_time": 3600,
+                "max_instances": 1,
+            },
+        )
 
         # Parse configured time
         hour, minute = map(int, self.config.digest.time.split(":"))
-        timezone = ZoneInfo(self.config.digest.timezone)
 
         trigger = CronTrigger(
             hour=hour,
             minute=minute,
-            timezone=timezone,
+            timezone=self._tz,
         )
 
         self._scheduler.add_job(
@@ -62,14 +86,55 @@ class DailyDigest:
             trigger,
             id="daily_digest",
             name="Generate daily knowledge digest",
+            replace_existing=True,
         )
 
         self._scheduler.start()
+        self._schedule_catchup(hour, minute)
         logger.info(
             f"Daily digest scheduled for {self.config.digest.time} "
             f"({self.config.digest.timezone})"
         )
 
+    def _schedule_catchup(self, hour: int, minute: int) -> None:
+        """Fire a digest shortly after startup if a run was just missed.
+
+        A restart around digest time would otherwise silently drop that
+        day's digest: the jobstore is in-memory, so the missed run is
+        detected explicitly by comparing the last scheduled fire time
+        against the recorded date of the last run.
+        """
+        now = datetime.now(self._tz)
+        last_fire = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if last_fire > now:
+            last_fire -= timedelta(days=1)
+        if (now - last_fire).total_seconds() > _CATCHUP_GRACE:
+            return
+        if self._read_last_run() == last_fire.date().isoformat():
+            return
+        logger.info("Missed digest run detected, scheduling catch-up")
+        self._scheduler.add_job(
+            self.generate_and_send_digest,
+            "date",
+            kwargs={"target_date": last_fire},
+            id="daily_digest_catchup",
+            name="Catch up missed daily digest",
+        )
+
+    def _read_last_run(self) -> Optional[str]:
+        """Read the date (ISO) of the last digest run, if recorded."""
+        try:
+            return self._state_path.read_text().strip()
+        except OSError:
+            return None
+
+    def _record_last_run(self, date_str: str) -> None:
+        """Record that the digest ran for a date."""
+        try:
+            self._state_path.write_text(date_str)
+        except OSError as e:
+            logger.warning(f"Could not record digest run: {e}")
+
     def stop_scheduler(self) -> None:
         """Stop the scheduler."""
         if self._scheduler:
@@ -86,8 +151,7 @@ class DailyDigest:
             Path to the saved digest file
         """
         if target_date is None:
-            tz = ZoneInfo(self.config.digest.timezone)
-            target_date = datetime.now(tz)
+            target_date = datetime.now(self._tz)
 
         date_str = target_date.strftime("%Y-%m-%d")
         logger.info(f"Generating daily digest for {date_str}")
@@ -97,6 +161,7 @@ class DailyDigest:
 
         if not content_items:
             logger.info(f"No content for {date_str}, skipping digest")
+            self._record_last_run(date_str)
             return ""
 
         # Generate digest summary
@@ -126,28 +191,20 @@ class DailyDigest:
             await self.send_telegram_message(message)
 
         logger.info(f"Daily digest saved to {vault_path}")
+        self._record_last_run(date_str)
         return vault_path
 
     def _gather_days_content(self, target_date: datetime) -> list[dict]:
         """Gather all content processed on a specific day."""
-        # Get content from vector store for the day
-        recent = self.vector_store.get_recent(days=1)
-
-        # Filter to exact date
-        date_str = target_date.strftime("%Y-%m-%d")
-        content_items = []
-
-        for item in recent:
-            item_date = item.created_at.strftime("%Y-%m-%d")
-            if item_date == date_str:
-                content_items.append({
-                    "type": item.content_type,
-                    "title": item.title,
-                    "summary": item.summary,
-                    "path": item.vault_path,
-                })
-
-        return content_items
+        # Explicit [midnight, midnight) range so past dates work too -
+        # the store filters in SQL (naive local time, matching storage)
+        start = datetime.combine(target_date.date(), time.min)
+        rows = self.vector_store.get_range(start, start + timedelta(days=1))
+
+        return [
+            {"type": content_type, "title": title, "summary": summary, "path": path}
+            for content_type, title, summary, path in rows
+        ]
 
     def _format_telegram_digest(
         self,
@@ -157,39 +214,27 @@ class DailyDigest:
         themes: list[str],
     ) -> str:
         """Format digest for Telegram delivery."""
+        # Content count summary (single C-level pass)
+        type_counts = Counter(item["type"] for item in content_items)
+        counts_str = ", ".join(f"{count} {t}(s)" for t, count in type_counts.items())
+
         message_parts = [
             f"📚 **Daily Knowledge Digest - {date_str}**\n",
+            f"Today you consumed: {counts_str}\n",
+            f"\n**Summary:**\n{summary}\n",
         ]
 
-        # Content count summary
-        type_counts = {}
-        for item in content_items:
-            t = item["type"]
-            type_counts[t] = type_counts.get(t, 0) + 1
-
-        counts_str = ", ".join(f"{count} {t}(s)" for t, count in type_counts.items())
-        message_parts.append(f"Today you consumed: {counts_str}\n")
-
-        # Summary
-        message_parts.append(f"\n**Summary:**\n{summary}\n")
-
         # Themes
         if themes:
             message_parts.append("\n**Key Themes:**")
-            for theme in themes[:5]:
-                message_parts.append(f"• {theme}")
+            message_parts.extend(f"• {theme}" for theme in themes[:5])
 
-        # Content list
+        # Content list (limited to avoid very long messages)
         message_parts.append("\n**Content Processed:**")
-        for item in content_items[:10]:  # Limit to avoid very long messages
-            emoji = {
-                "podcast": "🎙️",
-                "article": "📰",
-                "thread": "🧵",
-                "note": "📝",
-                "insight": "💡",
-            }.get(item["type"], "📄")
-            message_parts.append(f"{emoji} {item['title']}")
+        message_parts.extend(
+            f"{_TYPE_EMOJI.get(item['type'], '📄')} {item['title']}"
+            for item in content_items[:10]
+        )
 
         message_parts.append("\n_Check your Obsidian vault for the full digest with links._")
 
@@ -197,21 +242,17 @@ class DailyDigest:
 
     async def generate_weekly_summary(self) -> str:
         """Generate a weekly summary of all content."""
-        tz = ZoneInfo(self.config.digest.timezone)
-        end_date = datetime.now(tz)
+        end_date = datetime.now(self._tz)
         start_date = end_date - timedelta(days=7)
 
-        # Gather week's content
-        recent = self.vector_store.get_recent(days=7)
+        # Gather week's content - range filter runs in SQL and only the
+        # text fields come back (naive local time, matching storage)
+        now = datetime.now()
+        rows = self.vector_store.get_range(now - timedelta(days=7), now)
 
         content_items = [
-            {
-                "type": item.content_type,
-                "title": item.title,
-                "summary": item.summary,
-                "path": item.vault_path,
-            }
-            for item in recent
+            {"type": content_type, "title": title, "summary": summary, "path": path}
+            for content_type, title, summary, path in rows
         ]
 
         if not content_items:
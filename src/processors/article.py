@@ -1,9 +1,14 @@
 """Article extraction and processing."""
 
+import asyncio
 import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -12,9 +17,28 @@ import trafilatura
 
 from src.config import Config
 from src.storage.vault import ArticleMetadata, VaultWriter
+from src.storage.vectors import VectorStore
 
 logger = logging.getLogger(__name__)
 
+# Bound on concurrent article fetches in process_many
+_MAX_CONCURRENT = 8
+
+# Extraction cache entries older than this are considered stale
+_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Retry budget for transient fetch failures (timeouts, 5xx)
+_FETCH_ATTEMPTS = 3
+
+# Maps URL-slug separators to spaces in one str.translate pass
+_SLUG_SEPARATORS = str.maketrans("-_", "  ")
+
+# Summaries shorter than this carry too little signal to embed
+_MIN_EMBED_CHARS = 64
+
+# Recently computed summary embeddings kept for reuse
+_EMBED_CACHE_SIZE = 1024
+
 
 @dataclass
 class ArticleResult:
@@ -31,37 +55,103 @@ class ArticleResult:
 class ArticleProcessor:
     """Handles article extraction and processing."""
 
-    def __init__(self, config: Config, vault: VaultWriter):
+    def __init__(self, config: Config, vault: VaultWriter, vector_store: VectorStore | None = None):
         self.config = config
         self.vault = vault
+        # Shared store avoids reopening the sqlite handle per article
+        self.vector_store = vector_store or VectorStore(
+            config.obsidian.vault_path / ".vectors.db"
+        )
         self._summarizer = None
         self._embedder = None
+        self._client: httpx.AsyncClient | None = None
+        # LRU of summary-hash -> embedding (see _embed_summary)
+        self._embed_cache: OrderedDict[bytes, object] = OrderedDict()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazy create the shared HTTP client.
+
+        A single pooled client reuses connections (and HTTP/2 streams)
+        across article fetches instead of paying a TCP + TLS handshake
+        per request.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                headers={"User-Agent": "Mozilla/5.0 (compatible; KnowledgeBot/1.0)"},
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(connect=5.0, read=20.0, write=10.0, pool=5.0),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (called on shutdown)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
     def _get_summarizer(self):
         """Lazy load Claude summarizer."""
         if self._summarizer is None:
-            from src.ai.summarizer import Summarizer
-            self._summarizer = Summarizer(self.config)
+            from src.ai.summarizer import get_summarizer
+            self._summarizer = get_summarizer(self.config)
         return self._summarizer
 
     def _get_embedder(self):
         """Lazy load embedder."""
         if self._embedder is None:
-            from src.ai.embeddings import Embedder
-            self._embedder = Embedder()
+            from src.ai.embeddings import get_embedder
+            self._embedder = get_embedder()
         return self._embedder
 
-    async def process(self, url: str) -> ArticleResult:
-        """Process an article URL end-to-end."""
-        item_id = hashlib.md5(url.encode()).hexdigest()[:8]
+    @staticmethod
+    def _embed_key(summary: str) -> bytes:
+        return hashlib.blake2b(summary.encode(), digest_size=8).digest()
+
+    def _cached_embedding(self, summary: str):
+        """Look up a previously computed embedding for this summary."""
+        cached = self._embed_cache.get(self._embed_key(summary))
+        if cached is not None:
+            self._embed_cache.move_to_end(self._embed_key(summary))
+        return cached
+
+    def _store_embedding(self, summary: str, embedding) -> None:
+        """Remember an embedding, evicting the oldest past the cap."""
+        self._embed_cache[self._embed_key(summary)] = embedding
+        if len(self._embed_cache) > _EMBED_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)
+
+    def _embed_summary(self, summary: str):
+        """Embed a summary, or return None when it isn't worth embedding.
+
+        Very short summaries carry too little signal to justify an
+        inference call plus a similarity search, and duplicates reuse
+        the cached vector instead of re-encoding.
+        """
+        if len(summary) < _MIN_EMBED_CHARS:
+            return None
+
+        embedding = self._cached_embedding(summary)
+        if embedding is None:
+            embedding = self._get_embedder().embed(summary)
+            self._store_embedding(summary, embedding)
+        return embedding
+
+    async def _prepare(self, url: str) -> tuple[str, str, ArticleMetadata, dict]:
+        """Run the pre-embedding stages: fetch, extract, summarize."""
+        # blake2b is ~3x faster than md5 and this is an ID, not a
+        # cryptographic use; digest_size=4 keeps the 8-hex-char schema
+        item_id = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
 
-        # Step 1: Fetch and extract article
         content, metadata = await self._extract_article(url)
 
         if not content:
             raise ValueError(f"Could not extract content from {url}")
 
-        # Step 2: Generate summary
         summarizer = self._get_summarizer()
         summary_result = await summarizer.summarize_article(
             content=content,
@@ -70,20 +160,34 @@ class ArticleProcessor:
             url=url,
         )
 
-        # Step 3: Generate embedding and find connections
-        embedder = self._get_embedder()
-        embedding = embedder.embed(summary_result["summary"])
-
-        from src.storage.vectors import VectorStore
-        vector_store = VectorStore(self.config.obsidian.vault_path / ".vectors.db")
-        similar = vector_store.find_similar(embedding, top_k=5, exclude_id=item_id)
-
+        return item_id, content, metadata, summary_result
+
+    def _finish(
+        self,
+        url: str,
+        item_id: str,
+        content: str,
+        metadata: ArticleMetadata,
+        summary_result: dict,
+        embedding,
+    ) -> ArticleResult:
+        """Find connections and write to the vault.
+
+        The caller persists the embedding afterwards (per-item add, or
+        a batched add_many from process_many). A None embedding means
+        the summary was degenerate - no similarity search runs.
+        """
         connections = []
-        for cv, score in similar:
-            if score > 0.5:
-                connections.append(f"[[{cv.vault_path}|{cv.title}]] (similarity: {score:.2f})")
+        if embedding is not None:
+            # Relevance threshold applied inside the store's scan
+            similar = self.vector_store.find_similar(
+                embedding, top_k=5, exclude_id=item_id, min_score=0.5
+            )
+            connections = [
+                f"[[{cv.vault_path}|{cv.title}]] (similarity: {score:.2f})"
+                for cv, score in similar
+            ]
 
-        # Step 4: Save to vault
         vault_path = self.vault.save_article(
             metadata=metadata,
             content=content,
@@ -93,16 +197,6 @@ class ArticleProcessor:
             tags=summary_result.get("tags", []),
         )
 
-        # Step 5: Store embedding
-        vector_store.add(
-            content_id=item_id,
-            content_type="article",
-            title=metadata.title,
-            vault_path=vault_path,
-            summary=summary_result["summary"],
-            embedding=embedding,
-        )
-
         # Add summary to scratchpad
         self.vault.save_content_to_scratchpad(
             content_type="article",
@@ -120,76 +214,216 @@ class ArticleProcessor:
             url=url,
         )
 
+    async def process(self, url: str) -> ArticleResult:
+        """Process an article URL end-to-end."""
+        item_id, content, metadata, summary_result = await self._prepare(url)
+
+        embedding = self._embed_summary(summary_result["summary"])
+
+        result = self._finish(url, item_id, content, metadata, summary_result, embedding)
+
+        if embedding is not None:
+            self.vector_store.add(
+                content_id=item_id,
+                content_type="article",
+                title=metadata.title,
+                vault_path=result.vault_path,
+                summary=summary_result["summary"],
+                embedding=embedding,
+            )
+
+        return result
+
+    async def process_many(self, urls: list[str]) -> list[ArticleResult | Exception]:
+        """Process a batch of article URLs concurrently.
+
+        Fetch + summarize fan out with asyncio.gather under a semaphore
+        so the batch overlaps its network I/O; the embeddings are then
+        computed in a single batched encode and the vectors upserted in
+        one transaction. Failures come back as exceptions in the result
+        list (positionally matched to urls) rather than aborting the
+        batch.
+        """
+        sem = asyncio.Semaphore(_MAX_CONCURRENT)
+
+        async def _one(url: str) -> tuple[str, str, ArticleMetadata, dict]:
+            async with sem:
+                return await self._prepare(url)
+
+        prepared = await asyncio.gather(*(_one(u) for u in urls), return_exceptions=True)
+        results: list[ArticleResult | Exception] = list(prepared)
+
+        ok = [(i, p) for i, p in enumerate(prepared) if not isinstance(p, BaseException)]
+        if not ok:
+            return results
+
+        # One batched encode amortizes model overhead across the batch;
+        # degenerate summaries stay None and cache hits skip the encode
+        summaries = [p[3]["summary"] for _, p in ok]
+        embeddings: list = [None] * len(ok)
+        pending = []
+        for j, summary in enumerate(summaries):
+            if len(summary) < _MIN_EMBED_CHARS:
+                continue
+            cached = self._cached_embedding(summary)
+            if cached is not None:
+                embeddings[j] = cached
+            else:
+                pending.append(j)
+
+        if pending:
+            encoded = await asyncio.to_thread(
+                self._get_embedder().embed_batch, [summaries[j] for j in pending]
+            )
+            for j, embedding in zip(pending, encoded):
+                self._store_embedding(summaries[j], embedding)
+                embeddings[j] = embedding
+
+        rows = []
+        for (i, (item_id, content, metadata, summary_result)), embedding in zip(ok, embeddings):
+            try:
+                result = self._finish(
+                    urls[i], item_id, content, metadata, summary_result, embedding
+                )
+            except Exception as e:
+                results[i] = e
+                continue
+            results[i] = result
+            if embedding is not None:
+                rows.append(
+                    (
+                        item_id,
+                        "article",
+                        metadata.title,
+                        result.vault_path,
+                        summary_result["summary"],
+                        embedding,
+                    )
+                )
+
+        # Single transaction for the whole batch
+        self.vector_store.add_many(rows)
+
+        return results
+
+    async def _fetch_html(self, url: str) -> bytes:
+        """Fetch a page through the shared client with retry + backoff.
+
+        Returns raw bytes - trafilatura/lxml handles the encoding itself,
+        so skipping the .text decode avoids a full extra copy of the
+        page. Transient failures (timeouts, connection resets, 5xx) get
+        retried with exponential backoff so a flaky origin doesn't force
+        the caller to redo the whole pipeline. Client errors (4xx) raise
+        immediately - retrying them won't help.
+        """
+        last_exc: Exception = ValueError(f"No fetch attempts made for {url}")
+        for attempt in range(_FETCH_ATTEMPTS):
+            try:
+                async with self._get_client().stream("GET", url) as response:
+                    response.raise_for_status()
+                    return await response.aread()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code < 500:
+                    raise
+                last_exc = e
+            except httpx.TransportError as e:
+                last_exc = e
+            if attempt < _FETCH_ATTEMPTS - 1:
+                delay = 0.5 * (2 ** attempt)
+                logger.warning(f"Fetch failed ({last_exc}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        raise last_exc
+
+    def _cache_path(self, url: str) -> Path:
+        """Cache file path for a URL (keyed on a fast non-crypto hash)."""
+        key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return self.config.obsidian.vault_path / ".article_cache" / f"{key}.json"
+
+    def _cache_get(self, url: str) -> Optional[tuple[str, ArticleMetadata]]:
+        """Return a cached (content, metadata) pair, or None if missing/stale."""
+        path = self._cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime > _CACHE_TTL_SECONDS:
+                return None
+            with open(path) as f:
+                data = json.load(f)
+            return data["content"], ArticleMetadata(**data["metadata"])
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def _cache_put(self, url: str, content: str, metadata: ArticleMetadata) -> None:
+        """Persist an extraction result; failures are non-fatal."""
+        path = self._cache_path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({"content": content, "metadata": asdict(metadata)}, f)
+        except OSError as e:
+            logger.warning(f"Could not cache article extraction: {e}")
+
     async def _extract_article(self, url: str) -> tuple[str, ArticleMetadata]:
         """Extract article content and metadata from URL."""
+        # Skip the network + parse entirely on a fresh cache hit
+        cached = self._cache_get(url)
+        if cached is not None:
+            logger.info(f"Using cached extraction for: {url}")
+            return cached
+
         logger.info(f"Extracting article from: {url}")
 
-        # Fetch the page
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; KnowledgeBot/1.0)"
-                },
-            )
-            response.raise_for_status()
-            html = response.text
+        html = await self._fetch_html(url)
 
-        # Extract with trafilatura
-        downloaded = trafilatura.extract(
+        # Single trafilatura pass - bare_extraction parses the HTML once
+        # and yields both the body text and the metadata, instead of the
+        # previous three separate lxml parses (markdown attempt, txt
+        # fallback, extract_metadata). Runs in a thread so the CPU-bound
+        # lxml work doesn't block the event loop.
+        result = await asyncio.to_thread(
+            trafilatura.bare_extraction,
             html,
+            url=url,
             include_comments=False,
             include_tables=True,
             include_images=False,
             include_links=False,
-            output_format="markdown",
+            include_formatting=True,
             with_metadata=True,
-            url=url,
         )
 
-        if not downloaded:
-            # Fallback: try without markdown formatting
-            downloaded = trafilatura.extract(
-                html,
-                include_comments=False,
-                output_format="txt",
-                with_metadata=True,
-                url=url,
-            )
+        if result is None:
+            raise ValueError("Failed to extract article content")
+
+        # Older trafilatura returns a dict; newer returns a Document
+        if not isinstance(result, dict):
+            result = result.as_dict()
 
+        downloaded = result.get("text") or ""
         if not downloaded:
             raise ValueError("Failed to extract article content")
 
-        # Extract metadata
-        metadata_dict = trafilatura.extract_metadata(html, url=url)
+        title = result.get("title") or "Untitled"
+        author = result.get("author")
+        date = str(result["date"]) if result.get("date") else None
+        site_name = result.get("sitename")
 
-        title = "Untitled"
-        author = None
-        date = None
-        site_name = None
-
-        if metadata_dict:
-            title = metadata_dict.title or title
-            author = metadata_dict.author
-            date = str(metadata_dict.date) if metadata_dict.date else None
-            site_name = metadata_dict.sitename
+        # Parse the URL once for both the title fallback and site_name
+        parsed = urlparse(url)
 
         # If no title found, try to extract from URL
         if title == "Untitled":
-            parsed = urlparse(url)
             path_parts = parsed.path.strip("/").split("/")
             if path_parts:
-                title = path_parts[-1].replace("-", " ").replace("_", " ").title()
+                title = path_parts[-1].translate(_SLUG_SEPARATORS).title()
 
         metadata = ArticleMetadata(
             title=title,
             author=author,
             date=date or datetime.now().strftime("%Y-%m-%d"),
             url=url,
-            site_name=site_name or urlparse(url).netloc,
+            site_name=site_name or parsed.netloc,
         )
 
+        self._cache_put(url, downloaded, metadata)
         return downloaded, metadata
 
     async def extract_content_only(self, url: str) -> str:
@@ -197,18 +431,10 @@ class ArticleProcessor:
 
         Useful for previewing or when summary is not needed.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; KnowledgeBot/1.0)"
-                },
-            )
-            response.raise_for_status()
-            html = response.text
+        html = await self._fetch_html(url)
 
-        content = trafilatura.extract(
+        content = await asyncio.to_thread(
+            trafilatura.extract,
             html,
             include_comments=False,
             output_format="txt",
@@ -1,10 +1,21 @@
 """Podcast processing: download, transcribe, summarize."""
 
 import asyncio
+import concurrent.futures
 import hashlib
+import io
+import itertools
+import json
 import logging
+import os
 import re
+import shelve
+import shutil
 import tempfile
+import time
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from operator import attrgetter
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -19,23 +30,47 @@ from src.storage.vault import PodcastMetadata, Soundbite, VaultWriter
 
 logger = logging.getLogger(__name__)
 
+# Audio files above this size are downloaded as concurrent byte ranges
+_RANGE_THRESHOLD = 10 * 1024 * 1024
+_RANGE_PARTS = 4
 
-@dataclass
+# On-disk transcript cache cap; oldest entries evicted past this
+_TRANSCRIPT_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Cloud uploads longer than twice this are split into chunks this long
+# and transcribed concurrently
+_CLOUD_CHUNK_SECONDS = 600
+
+# Patterns compiled once instead of per call
+_SHOW_ID_RE = re.compile(r'/show/([a-zA-Z0-9]{22})')
+_TITLE_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+_HTML_TITLE_RE = re.compile(r'<title>([^<]+)</title>')
+_SPOTIFY_SUFFIX_RE = re.compile(r'\s*[|\-]\s*(?:Podcast|Spotify).*$', re.IGNORECASE)
+_VIDEO_SUFFIX_RE = re.compile(r'\s*[\|\-]\s*(Video|Full Episode|Official).*$', re.IGNORECASE)
+_RSS_URL_RE = re.compile(r"\.xml($|\?)|/feed|/rss|feed=|format=rss", re.IGNORECASE)
+
+
+# slots: a 2h episode yields thousands of segments, so dropping the
+# per-instance __dict__ saves real memory
+@dataclass(slots=True, frozen=True)
 class TranscriptSegment:
     """A segment of transcribed audio with timing."""
 
     text: str
     start: float  # seconds
     end: float  # seconds
+    # Start time as MM:SS or HH:MM:SS, formatted once at construction
+    timestamp: str = field(init=False)
 
-    @property
-    def timestamp(self) -> str:
-        """Format start time as MM:SS or HH:MM:SS."""
+    def __post_init__(self):
         hours, remainder = divmod(int(self.start), 3600)
         minutes, seconds = divmod(remainder, 60)
         if hours:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes:02d}:{seconds:02d}"
+            ts = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        else:
+            ts = f"{minutes:02d}:{seconds:02d}"
+        # frozen dataclass: bypass the blocked __setattr__
+        object.__setattr__(self, "timestamp", ts)
 
 
 @dataclass
@@ -53,6 +88,66 @@ class PodcastResult:
     transcript: str
 
 
+@dataclass(slots=True)
+class ParsedFeed:
+    """Minimal feedparser-shaped result from the streaming RSS parse."""
+
+    feed: dict
+    entries: list[dict]
+
+
+def _parse_rss_bytes(content: bytes) -> ParsedFeed:
+    """Parse an RSS feed with incremental ElementTree instead of feedparser.
+
+    Extracts only the fields the download path reads (titles, dates,
+    descriptions, enclosures, itunes duration), clearing each <item>
+    subtree as it completes so a 1000-episode feed never builds a full
+    DOM. Raises on malformed XML; the caller falls back to feedparser.
+    """
+    feed_meta: dict = {}
+    entries: list[dict] = []
+    in_item = False
+
+    for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+        tag = elem.tag.rsplit("}", 1)[-1] if isinstance(elem.tag, str) else ""
+        if event == "start":
+            if tag == "item":
+                in_item = True
+            continue
+        if tag == "item":
+            entry: dict = {"links": [], "enclosures": []}
+            for child in elem:
+                ctag = child.tag.rsplit("}", 1)[-1] if isinstance(child.tag, str) else ""
+                if ctag == "title":
+                    entry.setdefault("title", (child.text or "").strip())
+                elif ctag == "pubDate":
+                    entry["published"] = (child.text or "").strip()
+                elif ctag in ("description", "summary"):
+                    entry.setdefault("summary", (child.text or "").strip())
+                elif ctag == "duration":
+                    entry["itunes_duration"] = (child.text or "").strip()
+                elif ctag == "enclosure":
+                    entry["enclosures"].append(
+                        {"url": child.get("url", ""), "type": child.get("type", "")}
+                    )
+            entries.append(entry)
+            in_item = False
+            elem.clear()
+        elif tag == "title" and not in_item:
+            # First non-item title is the channel title
+            feed_meta.setdefault("title", (elem.text or "").strip())
+
+    return ParsedFeed(feed=feed_meta, entries=entries)
+
+
+@dataclass
+class SpotifyEpisodeInfo:
+    """Metadata scraped for a Spotify episode."""
+
+    show_id: Optional[str] = None
+    episode_title: Optional[str] = None
+
+
 @dataclass
 class QueueItem:
     """An item in the processing queue."""
@@ -75,8 +170,63 @@ class PodcastProcessor:
         self.vault = vault
         self.queue: list[QueueItem] = []
         self._whisper_model = None
+        self._whisper_batched = None
         self._summarizer = None
         self._embedder = None
+        self._vector_store = None
+        # Idle-unload bookkeeping for the local Whisper model
+        self._whisper_last_used = 0.0
+        self._idle_unload_task: Optional[asyncio.Task] = None
+        # PCM decoded during download, keyed by the audio path it stands in for
+        self._decoded_audio: dict = {}
+        # Known podcast hosts -> download handlers (checked after the
+        # RSS-pattern test; anything else falls through to yt-dlp)
+        self._host_handlers = {
+            "open.spotify.com": self._download_from_spotify,
+            "spotify.com": self._download_from_spotify,
+            "podcasts.apple.com": self._download_from_apple,
+        }
+        # Dedicated single worker for Whisper so transcriptions never
+        # compete with the default pool (yt-dlp, ffmpeg) for threads
+        self._whisper_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whisper"
+        )
+        # On-disk cache of parsed feeds (ETag/Last-Modified) + audio checks
+        self._rss_cache_path = config.obsidian.vault_path / ".rss_cache.db"
+        # Content-addressed transcript cache (see _transcribe)
+        self._transcript_cache_dir = config.obsidian.vault_path / ".transcripts"
+        # Bounds concurrent Whisper API requests across chunks/episodes
+        self._whisper_sem = asyncio.Semaphore(config.whisper.max_parallel)
+        # Long-lived client for metadata/RSS fetches - one TLS handshake
+        # and connection pool shared across the resolution steps
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            follow_redirects=True,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+            },
+        )
+
+        # Separate pooled client for audio downloads: long read timeout,
+        # HTTP/2 multiplexing, connect retries at the transport level
+        self._download_http = httpx.AsyncClient(
+            follow_redirects=True,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            },
+            timeout=httpx.Timeout(10.0, read=300.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            transport=httpx.AsyncHTTPTransport(retries=3, http2=True),
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients (called on shutdown)."""
+        if not self._http.is_closed:
+            await self._http.aclose()
+        if not self._download_http.is_closed:
+            await self._download_http.aclose()
+        self._whisper_pool.shutdown(wait=False)
 
     def _get_whisper_model(self):
         """Lazy load Whisper model."""
@@ -87,16 +237,42 @@ class PodcastProcessor:
             if device == "auto":
                 device = "cuda" if self._cuda_available() else "cpu"
 
-            compute_type = "float16" if device == "cuda" else "int8"
+            compute_type = self.config.whisper.compute_type
+            # int8 weights + fp16 activations roughly halves VRAM on
+            # modern GPUs at equal accuracy; CPU keeps CTranslate2's pick
+            if compute_type == "auto" and device == "cuda":
+                compute_type = "int8_float16"
 
             logger.info(
                 f"Loading Whisper model: {self.config.whisper.model_size} on {device}"
             )
+            # Keep the converted CTranslate2 snapshot on the persistent
+            # vault volume so redeploys don't re-download it
+            download_root = self.config.obsidian.vault_path / ".whisper-models"
             self._whisper_model = WhisperModel(
                 self.config.whisper.model_size,
                 device=device,
                 compute_type=compute_type,
+                cpu_threads=os.cpu_count() or 4,
+                num_workers=1,
+                download_root=str(download_root),
             )
+            # Log what CTranslate2 actually selected when "auto" resolves
+            selected = getattr(self._whisper_model.model, "compute_type", compute_type)
+            logger.info(f"Whisper compute type: {selected}")
+
+            # VAD-split + batched encoder passes; large throughput win on
+            # GPU, still worthwhile on CPU. Needs faster-whisper >= 1.1;
+            # older installs fall back to the unbatched transcribe.
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                logger.warning(
+                    "faster-whisper is too old for batched inference, "
+                    "transcribing unbatched (upgrade to >= 1.1.0)"
+                )
+            else:
+                self._whisper_batched = BatchedInferencePipeline(model=self._whisper_model)
         return self._whisper_model
 
     def _cuda_available(self) -> bool:
@@ -107,12 +283,33 @@ class PodcastProcessor:
         except ImportError:
             return False
 
+    def _touch_whisper_model(self) -> None:
+        """Record model use and arm the idle unloader."""
+        self._whisper_last_used = time.monotonic()
+        if self._idle_unload_task is None or self._idle_unload_task.done():
+            self._idle_unload_task = asyncio.create_task(self._idle_unloader())
+
+    async def _idle_unloader(self) -> None:
+        """Unload the Whisper model after a quiet period.
+
+        Keeping the model resident between queue items avoids paying a
+        full reload (hundreds of MB from disk) per episode; memory is
+        only reclaimed once no transcription has run for a while.
+        """
+        idle_seconds = self.config.whisper.idle_unload_seconds
+        while self._whisper_model is not None:
+            await asyncio.sleep(idle_seconds)
+            if time.monotonic() - self._whisper_last_used >= idle_seconds:
+                self.unload_whisper_model()
+                return
+
     def unload_whisper_model(self) -> None:
         """Unload Whisper model to free memory."""
         if self._whisper_model is not None:
             logger.info("Unloading Whisper model to free memory")
             del self._whisper_model
             self._whisper_model = None
+            self._whisper_batched = None
             # Force garbage collection
             import gc
             gc.collect()
@@ -120,24 +317,34 @@ class PodcastProcessor:
     def _get_summarizer(self):
         """Lazy load Claude summarizer."""
         if self._summarizer is None:
-            from src.ai.summarizer import Summarizer
-            self._summarizer = Summarizer(self.config)
+            from src.ai.summarizer import get_summarizer
+            self._summarizer = get_summarizer(self.config)
         return self._summarizer
 
     def _get_embedder(self):
         """Lazy load embedder."""
         if self._embedder is None:
-            from src.ai.embeddings import Embedder
-            self._embedder = Embedder()
+            from src.ai.embeddings import get_embedder
+            self._embedder = get_embedder()
         return self._embedder
 
+    def _get_vector_store(self):
+        """Lazy load vector store (kept open across queue items)."""
+        if self._vector_store is None:
+            from src.storage.vectors import VectorStore
+            self._vector_store = VectorStore(
+                self.config.obsidian.vault_path / ".vectors.db"
+            )
+        return self._vector_store
+
     async def process(self, url: str) -> PodcastResult:
         """Process a podcast URL end-to-end."""
         # Create queue item
-        item_id = hashlib.md5(url.encode()).hexdigest()[:8]
+        item_id = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
         queue_item = QueueItem(id=item_id, url=url, title="Processing...")
         self.queue.append(queue_item)
 
+        audio_path: Optional[Path] = None
         try:
             # Step 1: Resolve URL and get audio
             queue_item.status = "downloading"
@@ -169,15 +376,17 @@ class PodcastProcessor:
             embedder = self._get_embedder()
             embedding = embedder.embed(summary_result["summary"])
 
-            # Find connections to existing content
-            from src.storage.vectors import VectorStore
-            vector_store = VectorStore(self.config.obsidian.vault_path / ".vectors.db")
-            similar = vector_store.find_similar(embedding, top_k=5, exclude_id=item_id)
+            # Find connections to existing content (relevance threshold
+            # applied inside the store's scan)
+            vector_store = self._get_vector_store()
+            similar = vector_store.find_similar(
+                embedding, top_k=5, exclude_id=item_id, min_score=0.5
+            )
 
-            connections = []
-            for content, score in similar:
-                if score > 0.5:  # Relevance threshold
-                    connections.append(f"[[{content.vault_path}|{content.title}]] (similarity: {score:.2f})")
+            connections = [
+                f"[[{content.vault_path}|{content.title}]] (similarity: {score:.2f})"
+                for content, score in similar
+            ]
 
             # Step 5: Save to vault
             vault_path = self.vault.save_podcast(
@@ -208,10 +417,6 @@ class PodcastProcessor:
                 vault_path=vault_path,
             )
 
-            # Clean up audio file
-            if audio_path.exists():
-                audio_path.unlink()
-
             queue_item.status = "complete"
 
             duration = metadata.duration or 0
@@ -232,9 +437,22 @@ class PodcastProcessor:
             queue_item.error = str(e)
             raise
         finally:
+            # Clean up the whole download dir, error paths included
+            if audio_path is not None:
+                self._cleanup_audio(audio_path)
             # Remove from queue after a delay
             asyncio.create_task(self._remove_from_queue(item_id, delay=300))
 
+    def _cleanup_audio(self, audio_path: Path) -> None:
+        """Remove a download's temp directory and any stashed PCM.
+
+        Each download gets its own mkdtemp directory; deleting only the
+        audio file used to leak the directory (and any compressed copy)
+        on every episode.
+        """
+        self._decoded_audio.pop(audio_path, None)
+        shutil.rmtree(audio_path.parent, ignore_errors=True)
+
     async def process_transcript_only(
         self, url: str, status_callback: Optional[callable] = None
     ) -> dict:
@@ -247,7 +465,7 @@ class PodcastProcessor:
             url: The podcast URL to process
             status_callback: Optional async callable(status_msg: str) for progress updates
         """
-        item_id = hashlib.md5(url.encode()).hexdigest()[:8]
+        item_id = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
         queue_item = QueueItem(id=item_id, url=url, title="Processing...")
         self.queue.append(queue_item)
 
@@ -255,6 +473,7 @@ class PodcastProcessor:
             if status_callback:
                 await status_callback(msg)
 
+        audio_path: Optional[Path] = None
         try:
             # Step 1: Resolve URL and get audio
             queue_item.status = "downloading"
@@ -277,10 +496,6 @@ class PodcastProcessor:
             segments = await self._transcribe(audio_path, status_callback=report_status)
             full_transcript = self._segments_to_text(segments)
 
-            # Clean up audio file
-            if audio_path.exists():
-                audio_path.unlink()
-
             queue_item.status = "complete"
             await report_status("✅ **Step 3/3:** Transcription complete!")
 
@@ -297,8 +512,9 @@ class PodcastProcessor:
             queue_item.error = str(e)
             raise
         finally:
-            # Unload Whisper model to free memory after transcription
-            self.unload_whisper_model()
+            # Clean up the whole download dir, error paths included
+            if audio_path is not None:
+                self._cleanup_audio(audio_path)
             # Remove from queue after delay (handle case where event loop might not be running)
             try:
                 asyncio.create_task(self._remove_from_queue(item_id, delay=300))
@@ -308,44 +524,72 @@ class PodcastProcessor:
 
     async def _download_audio(self, url: str) -> tuple[Path, PodcastMetadata]:
         """Download audio from URL and extract metadata."""
-        parsed = urlparse(url)
-
         # Check if it's an RSS feed
         if self._is_rss_url(url):
             return await self._download_from_rss(url)
 
-        # Check if it's a Spotify link
-        if "spotify.com" in parsed.netloc:
-            return await self._download_from_spotify(url)
-
-        # Check if it's Apple Podcasts
-        if "podcasts.apple.com" in parsed.netloc:
-            return await self._download_from_apple(url)
-
-        # Try yt-dlp as fallback (works with many podcast hosts)
-        return await self._download_with_ytdlp(url)
+        # Known hosts dispatch on netloc; yt-dlp handles everything else
+        host = urlparse(url).netloc.removeprefix("www.")
+        handler = self._host_handlers.get(host, self._download_with_ytdlp)
+        return await handler(url)
 
     def _is_rss_url(self, url: str) -> bool:
         """Check if URL appears to be an RSS feed."""
-        rss_indicators = [".xml", "/feed", "/rss", "feed=", "format=rss"]
-        return any(indicator in url.lower() for indicator in rss_indicators)
+        return _RSS_URL_RE.search(url) is not None
+
+    def _rss_cache_get(self, key: str):
+        """Read a value from the on-disk RSS cache (None on any failure)."""
+        try:
+            with shelve.open(str(self._rss_cache_path)) as db:
+                return db.get(key)
+        except Exception as e:
+            logger.debug(f"RSS cache read failed: {e}")
+            return None
+
+    def _rss_cache_put(self, key: str, value) -> None:
+        """Write a value to the on-disk RSS cache (failures are non-fatal)."""
+        try:
+            with shelve.open(str(self._rss_cache_path)) as db:
+                db[key] = value
+        except Exception as e:
+            logger.debug(f"RSS cache write failed: {e}")
 
     async def _download_from_rss(self, feed_url: str, episode_index: int = 0, episode_title: str | None = None) -> tuple[Path, PodcastMetadata]:
         """Download from an RSS feed (most reliable method)."""
         logger.info(f"Parsing RSS feed: {feed_url}")
 
+        # Conditional GET: reuse the cached parse when the feed hasn't
+        # changed, skipping the full download and feedparser pass
+        cached = self._rss_cache_get(f"feed:{feed_url}")
+        headers = {"User-Agent": "Mozilla/5.0 (compatible; KnowledgeBot/1.0)"}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
         # Fetch RSS content with httpx (handles SSL better than feedparser's urllib)
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                feed_url,
-                follow_redirects=True,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; KnowledgeBot/1.0)"},
-            )
+        response = await self._http.get(feed_url, headers=headers, timeout=30.0)
+        if response.status_code == 304 and cached:
+            logger.info("RSS feed unchanged (304), using cached parse")
+            feed = cached[2]
+        else:
             response.raise_for_status()
-            rss_content = response.text
-
-        # Parse RSS feed from content
-        feed = feedparser.parse(rss_content)
+            # Incremental parse of just the fields we read; feedparser
+            # handles the feeds ElementTree chokes on (or finds empty)
+            try:
+                feed = _parse_rss_bytes(response.content)
+                if not feed.entries:
+                    raise ValueError("streaming parse found no items")
+            except Exception as e:
+                logger.debug(f"Streaming RSS parse failed ({e}), using feedparser")
+                feed = feedparser.parse(response.text)
+            etag = response.headers.get("etag", "")
+            last_modified = response.headers.get("last-modified", "")
+            # Only worth caching when the server sent validators
+            if etag or last_modified:
+                self._rss_cache_put(f"feed:{feed_url}", (etag, last_modified, feed))
 
         if not feed.entries:
             raise ValueError("No episodes found in RSS feed")
@@ -370,19 +614,17 @@ class PodcastProcessor:
             description=episode.get("summary", ""),
         )
 
-        # Find audio URL
-        audio_url = None
-        for link in episode.get("links", []):
-            if link.get("type", "").startswith("audio/"):
-                audio_url = link["href"]
-                break
-
-        # Try enclosures as fallback
-        if not audio_url:
-            for enclosure in episode.get("enclosures", []):
-                if enclosure.get("type", "").startswith("audio/"):
-                    audio_url = enclosure["url"]
-                    break
+        # Find audio URL - links first, enclosures as fallback, one pass
+        audio_url = next(
+            (
+                link.get("href") or link.get("url")
+                for link in itertools.chain(
+                    episode.get("links", ()), episode.get("enclosures", ())
+                )
+                if link.get("type", "").startswith("audio/")
+            ),
+            None,
+        )
 
         if not audio_url:
             raise ValueError("No audio URL found in RSS episode")
@@ -399,42 +641,68 @@ class PodcastProcessor:
 
     def _find_episode_by_title(self, entries: list, target_title: str):
         """Find an RSS episode matching the target title."""
-        target_lower = target_title.lower().strip()
-        # Try exact match first
+        target = target_title.casefold().strip()
+        target_words = set(target.split())
+        word_threshold = len(target_words) * 0.6 if len(target_words) >= 3 else None
+
+        # Single pass, keeping exact > substring > word-overlap priority:
+        # remember the first weaker match while scanning for a stronger one
+        substring_match = None
+        word_match = None
         for entry in entries:
-            if entry.get("title", "").lower().strip() == target_lower:
+            entry_title = entry.get("title", "").casefold().strip()
+            if entry_title == target:
                 return entry
-        # Try substring match (title might be truncated or have extra info)
-        for entry in entries:
-            entry_title = entry.get("title", "").lower().strip()
-            if target_lower in entry_title or entry_title in target_lower:
-                return entry
-        # Try word-based matching (at least 60% of words match)
-        target_words = set(target_lower.split())
-        if len(target_words) >= 3:
-            for entry in entries:
-                entry_words = set(entry.get("title", "").lower().split())
-                overlap = len(target_words & entry_words)
-                if overlap >= len(target_words) * 0.6:
-                    return entry
-        return None
+            if substring_match is None and (target in entry_title or entry_title in target):
+                substring_match = entry
+            elif substring_match is None and word_match is None and word_threshold is not None:
+                # Word-based matching (at least 60% of words match)
+                overlap = len(target_words & set(entry_title.split()))
+                if overlap >= word_threshold:
+                    word_match = entry
+        return substring_match or word_match
+
+    async def _spotify_metadata(
+        self, episode_id: str, need_show_id: bool = True
+    ) -> SpotifyEpisodeInfo:
+        """Scrape show ID and episode title for a Spotify episode.
+
+        One episode-page fetch plus one oEmbed fetch over the shared
+        client, instead of the separate per-field fetches (each with its
+        own throwaway client) this replaces.
+        """
+        episode_url = f"https://open.spotify.com/episode/{episode_id}"
+        info = SpotifyEpisodeInfo()
+
+        if need_show_id:
+            try:
+                response = await self._http.get(episode_url)
+                if response.status_code == 200:
+                    match = _SHOW_ID_RE.search(response.text)
+                    if match:
+                        info.show_id = match.group(1)
+                        logger.info(f"Extracted show ID from episode page: {info.show_id}")
+            except Exception as e:
+                logger.debug(f"Failed to fetch Spotify episode page: {e}")
 
-    async def _get_episode_title_from_spotify(self, episode_id: str) -> str | None:
-        """Get the episode title from Spotify using oEmbed API."""
         try:
-            episode_url = f"https://open.spotify.com/episode/{episode_id}"
             oembed_url = f"https://open.spotify.com/oembed?url={episode_url}"
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(oembed_url)
-                if response.status_code == 200:
-                    data = response.json()
-                    title = data.get("title", "")
-                    if title:
-                        logger.info(f"Got episode title from Spotify: {title}")
-                        return title
+            response = await self._http.get(oembed_url)
+            if response.status_code == 200:
+                data = response.json()
+                title = data.get("title", "")
+                if title:
+                    logger.info(f"Got episode title from Spotify: {title}")
+                    info.episode_title = title
+                # The oEmbed HTML sometimes carries the show link too
+                if need_show_id and not info.show_id:
+                    match = _SHOW_ID_RE.search(data.get("html", ""))
+                    if match:
+                        info.show_id = match.group(1)
         except Exception as e:
-            logger.debug(f"Failed to get episode title from Spotify: {e}")
-        return None
+            logger.debug(f"Failed to fetch Spotify oEmbed data: {e}")
+
+        return info
 
     async def _download_from_spotify(self, url: str) -> tuple[Path, PodcastMetadata]:
         """Download from Spotify by finding the RSS feed or using yt-dlp."""
@@ -454,15 +722,14 @@ class PodcastProcessor:
             elif part == "episode" and i + 1 < len(path_parts):
                 episode_id = path_parts[i + 1].split("?")[0]
 
-        # Get episode title for RSS matching if we have an episode ID
+        # Get episode title (and show ID, if missing) in one pass
         episode_title = None
         if episode_id:
-            episode_title = await self._get_episode_title_from_spotify(episode_id)
+            info = await self._spotify_metadata(episode_id, need_show_id=not show_id)
+            episode_title = info.episode_title
             logger.info(f"Target episode title from Spotify: {episode_title}")
-
-        # Try to find RSS feed first
-        if not show_id and episode_id:
-            show_id = await self._get_show_id_from_episode(episode_id)
+            if not show_id:
+                show_id = info.show_id
 
         rss_result = None
         rss_matched = False
@@ -546,73 +813,18 @@ class PodcastProcessor:
                 return True
         return False
 
-    async def _get_show_id_from_episode(self, episode_id: str) -> str | None:
-        """Get the show ID from a Spotify episode by fetching the episode page."""
-        try:
-            episode_url = f"https://open.spotify.com/episode/{episode_id}"
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                # Fetch the episode page - Spotify embeds show info in the HTML
-                response = await client.get(
-                    episode_url,
-                    follow_redirects=True,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-                    },
-                )
-
-                if response.status_code != 200:
-                    logger.debug(f"Failed to fetch episode page: {response.status_code}")
-                    return None
-
-                html = response.text
-
-                # Look for show link in the HTML
-                # Pattern: /show/[show_id] appears in the page
-                show_pattern = r'/show/([a-zA-Z0-9]{22})'
-                match = re.search(show_pattern, html)
-
-                if match:
-                    show_id = match.group(1)
-                    logger.info(f"Extracted show ID from episode page: {show_id}")
-                    return show_id
-
-                # Try oEmbed API as fallback
-                oembed_url = f"https://open.spotify.com/oembed?url={episode_url}"
-                oembed_response = await client.get(oembed_url)
-                if oembed_response.status_code == 200:
-                    data = oembed_response.json()
-                    # The HTML in oEmbed might contain show link
-                    oembed_html = data.get("html", "")
-                    match = re.search(show_pattern, oembed_html)
-                    if match:
-                        return match.group(1)
-
-        except Exception as e:
-            logger.debug(f"Failed to get show ID from episode: {e}")
-
-        return None
-
     async def _get_podcast_name_from_spotify(self, show_id: str) -> str | None:
         """Get the podcast name from Spotify show page."""
         try:
             show_url = f"https://open.spotify.com/show/{show_id}"
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    show_url,
-                    follow_redirects=True,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-                    },
-                )
-                if response.status_code == 200:
-                    # Look for the title in meta tags or og:title
-                    title_match = re.search(r'<title>([^<]+)</title>', response.text)
-                    if title_match:
-                        title = title_match.group(1)
-                        # Clean up " | Podcast on Spotify" suffix
-                        title = re.sub(r'\s*[|\-]\s*Podcast.*$', '', title, flags=re.IGNORECASE)
-                        title = re.sub(r'\s*[|\-]\s*Spotify.*$', '', title, flags=re.IGNORECASE)
-                        return title.strip()
+            response = await self._http.get(show_url)
+            if response.status_code == 200:
+                # Look for the title in meta tags or og:title
+                title_match = _HTML_TITLE_RE.search(response.text)
+                if title_match:
+                    # Clean up " | Podcast on Spotify" suffix
+                    title = _SPOTIFY_SUFFIX_RE.sub('', title_match.group(1))
+                    return title.strip()
         except Exception as e:
             logger.debug(f"Failed to get podcast name: {e}")
         return None
@@ -630,35 +842,34 @@ class PodcastProcessor:
                 "entity": "podcast",
                 "limit": 10,
             }
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(search_url, params=params)
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get("results", [])
-                    podcast_lower = podcast_name.lower().strip()
-
-                    # Priority 1: Exact name match (handles generic names like "Empire")
-                    for result in results:
-                        name = result.get("collectionName", "").lower().strip()
-                        feed_url = result.get("feedUrl")
-                        if feed_url and name == podcast_lower:
-                            logger.info(f"Found exact RSS match: {feed_url}")
-                            return feed_url
-
-                    # Priority 2: Substring match (podcast name appears in result)
-                    for result in results:
-                        name = result.get("collectionName", "").lower()
-                        feed_url = result.get("feedUrl")
-                        if feed_url and podcast_lower in name:
-                            logger.info(f"Found RSS via substring: {feed_url}")
-                            return feed_url
-
-                    # Priority 3: First result with a feed (best guess)
-                    for result in results:
-                        feed_url = result.get("feedUrl")
-                        if feed_url:
-                            logger.info(f"Found RSS feed via iTunes (best guess): {feed_url}")
-                            return feed_url
+            response = await self._http.get(search_url, params=params)
+            if response.status_code == 200:
+                data = response.json()
+                results = data.get("results", [])
+                podcast_lower = podcast_name.lower().strip()
+
+                # Priority 1: Exact name match (handles generic names like "Empire")
+                for result in results:
+                    name = result.get("collectionName", "").lower().strip()
+                    feed_url = result.get("feedUrl")
+                    if feed_url and name == podcast_lower:
+                        logger.info(f"Found exact RSS match: {feed_url}")
+                        return feed_url
+
+                # Priority 2: Substring match (podcast name appears in result)
+                for result in results:
+                    name = result.get("collectionName", "").lower()
+                    feed_url = result.get("feedUrl")
+                    if feed_url and podcast_lower in name:
+                        logger.info(f"Found RSS via substring: {feed_url}")
+                        return feed_url
+
+                # Priority 3: First result with a feed (best guess)
+                for result in results:
+                    feed_url = result.get("feedUrl")
+                    if feed_url:
+                        logger.info(f"Found RSS feed via iTunes (best guess): {feed_url}")
+                        return feed_url
 
         except Exception as e:
             logger.debug(f"iTunes lookup failed: {e}")
@@ -680,14 +891,13 @@ class PodcastProcessor:
         # Method 2: Try spotifeed as fallback (but note: it often lacks audio URLs)
         spotifeed_url = f"https://spotifeed.timdorr.com/{show_id}"
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.head(spotifeed_url, follow_redirects=True)
-                if response.status_code == 200:
-                    # Check if spotifeed actually has audio
-                    if await self._rss_has_audio(spotifeed_url):
-                        return spotifeed_url
-                    else:
-                        logger.debug("Spotifeed has no audio URLs, skipping")
+            response = await self._http.head(spotifeed_url)
+            if response.status_code == 200:
+                # Check if spotifeed actually has audio
+                if await self._rss_has_audio(spotifeed_url):
+                    return spotifeed_url
+                else:
+                    logger.debug("Spotifeed has no audio URLs, skipping")
         except Exception as e:
             logger.debug(f"Spotifeed lookup failed: {e}")
 
@@ -695,17 +905,30 @@ class PodcastProcessor:
 
     async def _rss_has_audio(self, feed_url: str) -> bool:
         """Check if an RSS feed has audio enclosures."""
+        # Whether a feed carries audio is stable; remember it for 24h
+        cached = self._rss_cache_get(f"audio:{feed_url}")
+        if cached and time.time() - cached[1] < 86400:
+            return cached[0]
+
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    feed_url,
-                    follow_redirects=True,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; KnowledgeBot/1.0)"},
-                )
-                if response.status_code == 200:
-                    # Quick check for enclosure tags with audio
-                    content = response.text
-                    return 'type="audio' in content or "type='audio" in content
+            # The first enclosure almost always sits in the first few KB,
+            # so an 8KB range beats pulling a multi-MB feed
+            response = await self._http.get(
+                feed_url, headers={"Range": "bytes=0-8191"}
+            )
+            if response.status_code in (200, 206):
+                # Quick check for enclosure tags with audio (bytes: no decode)
+                content = response.content
+                has_audio = b'type="audio' in content or b"type='audio" in content
+                if not has_audio and response.status_code == 206:
+                    # Range honored but no enclosure in the prefix; only a
+                    # full fetch can say for sure
+                    full = await self._http.get(feed_url)
+                    if full.status_code == 200:
+                        content = full.content
+                        has_audio = b'type="audio' in content or b"type='audio" in content
+                self._rss_cache_put(f"audio:{feed_url}", (has_audio, time.time()))
+                return has_audio
         except Exception as e:
             logger.debug(f"Failed to check RSS for audio: {e}")
         return False
@@ -765,7 +988,7 @@ class PodcastProcessor:
         # For video podcasts, the title might include extra info - clean it up
         title = info.get("title", "Unknown")
         # Remove common video podcast suffixes
-        title = re.sub(r'\s*[\|\-]\s*(Video|Full Episode|Official).*$', '', title, flags=re.IGNORECASE)
+        title = _VIDEO_SUFFIX_RE.sub('', title)
 
         metadata = PodcastMetadata(
             title=title,
@@ -781,76 +1004,400 @@ class PodcastProcessor:
     async def _download_audio_file(self, url: str, title: str) -> Path:
         """Download an audio file from a direct URL."""
         temp_dir = Path(tempfile.mkdtemp())
-        safe_title = re.sub(r'[<>:"/\\|?*]', "", title)[:50]
+        safe_title = _TITLE_SANITIZE_RE.sub("", title)[:50]
         audio_path = temp_dir / f"{safe_title}.mp3"
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        }
-        timeout = httpx.Timeout(10.0, read=300.0)  # 5 min read timeout for large files
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True, headers=headers) as client:
-            async with client.stream("GET", url) as response:
-                response.raise_for_status()
-                with open(audio_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=65536):
-                        f.write(chunk)
+        if self.config.whisper.mode == "local":
+            # Local mode never needs the file on disk: decode straight to
+            # PCM while downloading and stash it for _transcribe_local
+            pcm = await self._stream_and_decode(url)
+            self._decoded_audio[audio_path] = pcm
+            logger.info(f"Streamed audio decode: {pcm.nbytes / (1024*1024):.1f}MB PCM")
+            return audio_path
+
+        # Large files from range-capable hosts download as parallel parts
+        if await self._try_ranged_download(url, audio_path):
+            logger.info(f"Downloaded audio (ranged): {audio_path.stat().st_size / (1024*1024):.1f}MB")
+            return audio_path
+
+        async with self._download_http.stream("GET", url) as response:
+            response.raise_for_status()
+            with open(audio_path, "wb") as f:
+                # Preallocate when the size is known to cut fragmentation
+                length = int(response.headers.get("content-length") or 0)
+                if length and hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(f.fileno(), 0, length)
+                async for chunk in response.aiter_bytes(chunk_size=65536):
+                    f.write(chunk)
 
         logger.info(f"Downloaded audio: {audio_path.stat().st_size / (1024*1024):.1f}MB")
         return audio_path
 
+    async def _try_ranged_download(self, url: str, audio_path: Path) -> bool:
+        """Download a large file as concurrent byte-range parts.
+
+        Returns False (leaving no file behind) when the host doesn't
+        advertise range support or the file is small enough that the
+        parallelism wouldn't pay for itself - the caller then streams
+        sequentially.
+        """
+        try:
+            head = await self._download_http.head(url)
+            length = int(head.headers.get("content-length") or 0)
+            if length < _RANGE_THRESHOLD or head.headers.get("accept-ranges", "").lower() != "bytes":
+                return False
+
+            part = length // _RANGE_PARTS
+            bounds = [
+                (i * part, (i + 1) * part - 1 if i < _RANGE_PARTS - 1 else length - 1)
+                for i in range(_RANGE_PARTS)
+            ]
+
+            with open(audio_path, "wb") as f:
+                f.truncate(length)
+                fd = f.fileno()
+
+                async def fetch_part(start: int, end: int) -> None:
+                    offset = start
+                    async with self._download_http.stream(
+                        "GET", url, headers={"Range": f"bytes={start}-{end}"}
+                    ) as response:
+                        if response.status_code != 206:
+                            raise ValueError(f"Range request got {response.status_code}")
+                        async for chunk in response.aiter_bytes(chunk_size=65536):
+                            os.pwrite(fd, chunk, offset)
+                            offset += len(chunk)
+
+                await asyncio.gather(*(fetch_part(a, b) for a, b in bounds))
+            return True
+        except Exception as e:
+            logger.debug(f"Ranged download unavailable for {url}: {e}")
+            if audio_path.exists():
+                audio_path.unlink()
+            return False
+
+    async def _stream_and_decode(self, url: str):
+        """Stream a download through ffmpeg into 16kHz mono float32 PCM.
+
+        Overlaps the network transfer with the decode and skips the
+        write-then-reread round trip through a temp file; the returned
+        numpy array feeds faster-whisper directly.
+        """
+        import numpy as np
+
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-f", "s16le", "-ac", "1", "-ar", "16000",
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        async def feed_stdin():
+            try:
+                async with self._download_http.stream("GET", url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(chunk_size=65536):
+                        proc.stdin.write(chunk)
+                        await proc.stdin.drain()
+            finally:
+                proc.stdin.close()
+
+        feeder = asyncio.create_task(feed_stdin())
+
+        pcm = bytearray()
+        while True:
+            block = await proc.stdout.read(65536)
+            if not block:
+                break
+            pcm += block
+
+        await feeder
+        await proc.wait()
+        if proc.returncode != 0 or not pcm:
+            stderr = await proc.stderr.read()
+            raise ValueError(f"ffmpeg decode failed: {stderr.decode(errors='replace')[:200]}")
+
+        return np.frombuffer(bytes(pcm), dtype=np.int16).astype(np.float32) / 32768.0
+
     async def _transcribe(self, audio_path: Path, status_callback=None) -> list[TranscriptSegment]:
-        """Transcribe audio file using Whisper (local or cloud)."""
+        """Transcribe audio file using Whisper (local or cloud).
+
+        Results are cached on disk keyed by audio content hash, so
+        retries and re-runs of the same episode skip the minutes of
+        upload/compute entirely.
+        """
         logger.info(f"Transcribing: {audio_path}")
 
+        cache_key = await self._transcript_cache_key(audio_path)
+        if cache_key:
+            cached = self._transcript_cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"Transcript cache hit ({len(cached)} segments)")
+                return cached
+
         # Check if we should use cloud transcription
         if self.config.whisper.mode == "cloud":
-            return await self._transcribe_cloud(audio_path, status_callback=status_callback)
+            segments = await self._transcribe_cloud(audio_path, status_callback=status_callback)
         else:
-            return await self._transcribe_local(audio_path)
+            segments = await self._transcribe_local(audio_path)
 
-    async def _compress_audio_for_cloud(self, audio_path: Path) -> Path:
-        """Compress audio to under 25MB for OpenAI API limit."""
-        import subprocess
+        if cache_key:
+            self._transcript_cache_put(cache_key, segments)
+        return segments
 
-        file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-        logger.info(f"Original audio size: {file_size_mb:.1f}MB")
+    async def _transcript_cache_key(self, audio_path: Path) -> Optional[str]:
+        """Content hash of the audio plus the transcription backend.
 
-        # OpenAI limit is 25MB, target 20MB to be safe
-        if file_size_mb <= 20:
-            return audio_path
+        Hashes the stashed PCM when the episode was decoded in-memory,
+        otherwise streams the file; None when there's nothing to hash.
+        The mode/model suffix keeps local and cloud results apart.
+        """
+        whisper = self.config.whisper
+        backend = (
+            f"local:{whisper.model_size}" if whisper.mode == "local" else "cloud"
+        )
 
-        # Compress using ffmpeg - mono, 16kHz (Whisper's native rate), low bitrate
-        compressed_path = audio_path.with_suffix('.compressed.mp3')
+        pcm = self._decoded_audio.get(audio_path)
+        if pcm is not None:
+            digest = hashlib.sha256(pcm.tobytes()).hexdigest()
+        elif audio_path.exists():
 
-        # Calculate target bitrate based on file size
-        # Target ~20MB, audio duration estimated from file size
-        target_bitrate = "32k"  # Very compressed but sufficient for speech
+            def hash_file() -> str:
+                h = hashlib.sha256()
+                with open(audio_path, "rb") as f:
+                    while chunk := f.read(1024 * 1024):
+                        h.update(chunk)
+                return h.hexdigest()
 
-        cmd = [
-            "ffmpeg", "-y", "-i", str(audio_path),
-            "-ac", "1",           # Mono
-            "-ar", "16000",       # 16kHz (Whisper's native sample rate)
-            "-b:a", target_bitrate,
-            "-map", "0:a",        # Audio only
-            str(compressed_path)
-        ]
+            digest = await asyncio.to_thread(hash_file)
+        else:
+            return None
+        return hashlib.sha256(f"{backend}:{digest}".encode()).hexdigest()
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: subprocess.run(cmd, capture_output=True, check=True)
+    def _transcript_cache_get(self, key: str) -> Optional[list[TranscriptSegment]]:
+        """Load cached segments for a key (None on miss or bad entry)."""
+        path = self._transcript_cache_dir / f"{key}.json"
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            return [
+                TranscriptSegment(text=s["text"], start=s["start"], end=s["end"])
+                for s in data
+            ]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Transcript cache read failed: {e}")
+            return None
+
+    def _transcript_cache_put(self, key: str, segments: list[TranscriptSegment]) -> None:
+        """Store segments in the cache and evict oldest past the cap."""
+        try:
+            self._transcript_cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._transcript_cache_dir / f"{key}.json"
+            with open(path, "w") as f:
+                json.dump(
+                    [{"text": s.text, "start": s.start, "end": s.end} for s in segments],
+                    f,
+                )
+
+            # Size-gated eviction, oldest first
+            entries = sorted(
+                self._transcript_cache_dir.glob("*.json"),
+                key=lambda p: p.stat().st_mtime,
+            )
+            total = sum(p.stat().st_size for p in entries)
+            while entries and total > _TRANSCRIPT_CACHE_MAX_BYTES:
+                victim = entries.pop(0)
+                total -= victim.stat().st_size
+                victim.unlink()
+        except Exception as e:
+            logger.debug(f"Transcript cache write failed: {e}")
+
+    async def _compress_audio_for_cloud(self, audio_path: Path) -> Path:
+        """Compress audio to under 25MB for OpenAI API limit."""
+        file_size_mb = audio_path.stat().st_size / (1024 * 1024)
+        logger.info(f"Original audio size: {file_size_mb:.1f}MB")
+
+        # Cloud APIs bill per audio-minute, so speeding speech up before
+        # upload cuts cost and latency by the same factor. When active,
+        # every file goes through the encoder; the no-op shortcuts below
+        # only apply at the original rate.
+        factor = max(1.0, self.config.whisper.speedup_factor)
+
+        compact = False
+        if factor == 1.0:
+            # OpenAI limit is 25MB, target 20MB to be safe
+            if file_size_mb <= 20:
+                return audio_path
+
+            probe = await self._probe_audio(audio_path)
+            compact = (
+                probe is not None
+                and probe["codec"] in ("mp3", "opus", "aac", "vorbis")
+                and probe["channels"] <= 2
+                and 0 < probe["bit_rate"] <= 48000
+            )
+
+            # Slightly over target but already a compact speech encode
+            # that fits the API cap: skip the ffmpeg pass entirely
+            if file_size_mb <= 24 and compact:
+                logger.info("Audio already compact, skipping re-encode")
+                return audio_path
+
+        if compact:
+            # Oversize despite a low-bitrate stream - the bulk is
+            # artwork/video, so remux audio-only without re-encoding
+            ext = {"mp3": ".mp3", "aac": ".m4a"}.get(probe["codec"], ".ogg")
+            compressed_path = audio_path.with_suffix(".compressed" + ext)
+            cmd = [
+                "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+                "-i", str(audio_path),
+                "-vn", "-c:a", "copy",
+                str(compressed_path),
+            ]
+        else:
+            # Opus in Ogg (accepted by Groq and OpenAI) at a
+            # speech-tuned 16k; roughly half the size of the 32k MP3
+            # this replaces at comparable Whisper accuracy
+            compressed_path = audio_path.with_suffix('.compressed.ogg')
+            cmd = [
+                "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+                "-threads", "0",      # Let the encoder use all cores
+                "-i", str(audio_path),
+                "-vn",                # Audio only
+                "-ac", "1",           # Mono
+                "-ar", "16000",       # 16kHz (Whisper's native sample rate)
+            ]
+            if factor > 1.0:
+                cmd += ["-filter:a", self._atempo_chain(factor)]
+            cmd += [
+                "-c:a", "libopus",
+                "-b:a", "16k",
+                "-application", "voip",
+                "-vbr", "on",
+                "-compression_level", "10",
+                str(compressed_path)
+            ]
+
+        # Native asyncio subprocess: no executor thread pinned for the
+        # multi-second encode
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
         )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg compression failed: {stderr.decode()[:500]}")
 
         compressed_size_mb = compressed_path.stat().st_size / (1024 * 1024)
         logger.info(f"Compressed audio size: {compressed_size_mb:.1f}MB")
 
-        # Clean up original if compression worked
-        if compressed_path.exists() and compressed_size_mb < file_size_mb:
+        # Clean up original if compression worked. When speedup is
+        # active the sped-up encode must be used even if it came out
+        # larger - downstream timestamp math scales by the factor
+        # unconditionally, so returning the unsped original would
+        # inflate every timestamp.
+        if compressed_path.exists() and (factor > 1.0 or compressed_size_mb < file_size_mb):
             audio_path.unlink()
             return compressed_path
 
         return audio_path
 
+    async def _encode_audio_to_memory(self, audio_path: Path) -> Optional[bytes]:
+        """Encode for cloud upload with ffmpeg writing to a pipe.
+
+        Same Opus settings as _compress_audio_for_cloud, but stdout goes
+        straight into memory so the encode skips the disk entirely.
+        Returns None on failure (callers fall back to the file path).
+        """
+        factor = max(1.0, self.config.whisper.speedup_factor)
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-threads", "0",
+            "-i", str(audio_path),
+            "-vn", "-ac", "1", "-ar", "16000",
+        ]
+        if factor > 1.0:
+            cmd += ["-filter:a", self._atempo_chain(factor)]
+        cmd += [
+            "-c:a", "libopus",
+            "-b:a", "16k",
+            "-application", "voip",
+            "-vbr", "on",
+            "-compression_level", "10",
+            "-f", "ogg", "pipe:1",
+        ]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            out, stderr = await proc.communicate()
+            if proc.returncode != 0 or not out:
+                logger.debug(f"In-memory encode failed: {stderr.decode()[:200]}")
+                return None
+            logger.info(f"Encoded audio to memory: {len(out) / (1024 * 1024):.1f}MB")
+            return out
+        except Exception as e:
+            logger.debug(f"In-memory encode failed: {e}")
+            return None
+
+    @staticmethod
+    def _atempo_chain(factor: float) -> str:
+        """Build an atempo filter chain (each stage caps at 2.0x)."""
+        parts = []
+        while factor > 2.0:
+            parts.append("atempo=2.0")
+            factor /= 2.0
+        parts.append(f"atempo={factor:g}")
+        return ",".join(parts)
+
+    async def _probe_audio(self, audio_path: Path) -> Optional[dict]:
+        """Probe the first audio stream with ffprobe.
+
+        Returns {"codec", "channels", "bit_rate", "duration"} or None
+        when the probe fails; bit_rate falls back to the container-level
+        value (0 when neither is reported).
+        """
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name,channels,bit_rate",
+            "-show_entries", "format=bit_rate,duration",
+            "-of", "json",
+            str(audio_path),
+        ]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            out, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+            if proc.returncode != 0:
+                return None
+            info = json.loads(out)
+            stream = (info.get("streams") or [{}])[0]
+            return {
+                "codec": stream.get("codec_name", ""),
+                "channels": int(stream.get("channels") or 0),
+                "bit_rate": int(
+                    stream.get("bit_rate")
+                    or info.get("format", {}).get("bit_rate")
+                    or 0
+                ),
+                "duration": float(info.get("format", {}).get("duration") or 0),
+            }
+        except Exception as e:
+            logger.debug(f"ffprobe check failed: {e}")
+            return None
+
     def _get_openai_fallback_key(self) -> str:
         """Get a real OpenAI key for fallback (not a Groq key).
 
@@ -874,6 +1421,92 @@ class PodcastProcessor:
     async def _transcribe_cloud(self, audio_path: Path, status_callback=None) -> list[TranscriptSegment]:
         """Transcribe using Groq or OpenAI Whisper API (fast, cloud-based).
 
+        Long episodes are split into fixed-length chunks transcribed
+        concurrently (bounded by whisper.max_parallel); short ones go up
+        as a single request.
+        """
+        # Short episodes that need an encode are piped straight from
+        # ffmpeg into the upload buffer: one pass, no intermediate file
+        factor = max(1.0, self.config.whisper.speedup_factor)
+        probe = await self._probe_audio(audio_path)
+        if (
+            probe
+            and 0 < probe["duration"]
+            and probe["duration"] / factor < 2 * _CLOUD_CHUNK_SECONDS
+            and (factor > 1.0 or audio_path.stat().st_size > 20 * 1024 * 1024)
+        ):
+            encoded = await self._encode_audio_to_memory(audio_path)
+            if encoded is not None and len(encoded) <= 24 * 1024 * 1024:
+                return await self._transcribe_cloud_file(
+                    io.BytesIO(encoded), status_callback=status_callback
+                )
+
+        # Compress audio for cloud APIs (25MB limit)
+        audio_path = await self._compress_audio_for_cloud(audio_path)
+
+        chunks = await self._split_audio_for_cloud(audio_path)
+        if chunks:
+            logger.info(f"Transcribing {len(chunks)} chunks concurrently")
+            # Chunk-level status spam is suppressed; errors still raise
+            results = await asyncio.gather(
+                *(self._transcribe_cloud_file(c) for c in chunks)
+            )
+            # Chunk boundaries are in upload time; scale to real time
+            # the same way segment timestamps are
+            factor = max(1.0, self.config.whisper.speedup_factor)
+            segments = []
+            for i, chunk_segments in enumerate(results):
+                offset = i * _CLOUD_CHUNK_SECONDS * factor
+                segments.extend(
+                    TranscriptSegment(text=s.text, start=s.start + offset, end=s.end + offset)
+                    for s in chunk_segments
+                )
+            return segments
+
+        return await self._transcribe_cloud_file(audio_path, status_callback=status_callback)
+
+    async def _split_audio_for_cloud(self, audio_path: Path) -> list[Path]:
+        """Split long audio into chunks for parallel transcription.
+
+        Returns [] when the episode is short enough for one request or
+        the split fails (callers then upload the file whole). Chunks are
+        stream-copied, so the split itself costs no re-encode.
+        """
+        probe = await self._probe_audio(audio_path)
+        if not probe or probe["duration"] < 2 * _CLOUD_CHUNK_SECONDS:
+            return []
+
+        chunk_dir = audio_path.parent / "chunks"
+        chunk_dir.mkdir(exist_ok=True)
+        pattern = chunk_dir / f"%03d{audio_path.suffix}"
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-i", str(audio_path),
+            "-f", "segment",
+            "-segment_time", str(_CLOUD_CHUNK_SECONDS),
+            "-c", "copy",
+            str(pattern),
+        ]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                logger.debug(f"Audio split failed: {stderr.decode()[:200]}")
+                return []
+        except Exception as e:
+            logger.debug(f"Audio split failed: {e}")
+            return []
+        return sorted(chunk_dir.glob(f"*{audio_path.suffix}"))
+
+    async def _transcribe_cloud_file(
+        self, audio: Path | io.BytesIO, status_callback=None
+    ) -> list[TranscriptSegment]:
+        """Send one file (or in-memory buffer) to Whisper, with Groq-to-OpenAI fallback.
+
         If Groq fails with 429 (rate limit) or 413 (file too large), automatically
         falls back to OpenAI if a real OpenAI key is configured.
         """
@@ -881,13 +1514,10 @@ class PodcastProcessor:
 
         use_groq = bool(self.config.whisper.groq_api_key)
 
-        # Compress audio for cloud APIs (25MB limit)
-        audio_path = await self._compress_audio_for_cloud(audio_path)
-
         if use_groq:
             try:
                 return await self._call_whisper_api(
-                    audio_path,
+                    audio,
                     api_key=self.config.whisper.groq_api_key,
                     base_url="https://api.groq.com/openai/v1",
                     model="whisper-large-v3-turbo",
@@ -910,7 +1540,7 @@ class PodcastProcessor:
             fallback_key = self._get_openai_fallback_key()
             logger.info("Falling back to OpenAI Whisper API")
             return await self._call_whisper_api(
-                audio_path,
+                audio,
                 api_key=fallback_key,
                 base_url=None,
                 model="whisper-1",
@@ -920,7 +1550,7 @@ class PodcastProcessor:
             # No Groq key — use OpenAI directly (check OPENAI_WHISPER_KEY too)
             openai_key = self._get_openai_fallback_key() or self.config.whisper.openai_api_key
             return await self._call_whisper_api(
-                audio_path,
+                audio,
                 api_key=openai_key,
                 base_url=None,
                 model="whisper-1",
@@ -929,7 +1559,7 @@ class PodcastProcessor:
 
     async def _call_whisper_api(
         self,
-        audio_path: Path,
+        audio: Path | io.BytesIO,
         api_key: str,
         base_url: str | None,
         model: str,
@@ -943,64 +1573,104 @@ class PodcastProcessor:
         client_kwargs = {"api_key": api_key}
         if base_url:
             client_kwargs["base_url"] = base_url
-        client = openai.OpenAI(**client_kwargs)
+        client = openai.AsyncOpenAI(**client_kwargs)
 
-        loop = asyncio.get_event_loop()
+        if isinstance(audio, Path):
+            # Read off the loop; the async client then uploads with
+            # native async I/O instead of pinning an executor thread
+            # for the whole upload + transcription window
+            upload = (audio.name, await asyncio.to_thread(audio.read_bytes))
+        else:
+            # In-memory buffer from the pipe encoder; rewind in case a
+            # prior provider attempt consumed it
+            audio.seek(0)
+            upload = ("audio.ogg", audio, "audio/ogg")
 
-        def run_cloud_transcription():
-            with open(audio_path, "rb") as audio_file:
-                response = client.audio.transcriptions.create(
+        try:
+            async with self._whisper_sem:
+                response = await client.audio.transcriptions.create(
                     model=model,
-                    file=audio_file,
+                    file=upload,
                     response_format="verbose_json",
                     timestamp_granularities=["segment"],
                 )
-            return response
-
-        response = await loop.run_in_executor(None, run_cloud_transcription)
-
-        # Convert response to TranscriptSegment format
-        segments = []
-        if hasattr(response, 'segments') and response.segments:
-            for seg in response.segments:
-                text = seg.get('text', '').strip() if isinstance(seg, dict) else getattr(seg, 'text', '').strip()
-                start = seg.get('start', 0) if isinstance(seg, dict) else getattr(seg, 'start', 0)
-                end = seg.get('end', 0) if isinstance(seg, dict) else getattr(seg, 'end', 0)
-                if text:
-                    segments.append(TranscriptSegment(text=text, start=start, end=end))
+        finally:
+            await client.close()
+
+        # Convert response to TranscriptSegment format. The upload may
+        # have been sped up, so scale timestamps back to real time.
+        # Responses come back with thousands of segments, all the same
+        # shape - detect dict vs object once instead of per segment.
+        factor = max(1.0, self.config.whisper.speedup_factor)
+        raw = getattr(response, "segments", None)
+        if raw and isinstance(raw[0], dict):
+            segments = [
+                TranscriptSegment(
+                    text=text,
+                    start=seg.get("start", 0) * factor,
+                    end=seg.get("end", 0) * factor,
+                )
+                for seg in raw
+                if (text := seg.get("text", "").strip())
+            ]
+        elif raw:
+            fields = attrgetter("text", "start", "end")
+            segments = [
+                TranscriptSegment(text=stripped, start=start * factor, end=end * factor)
+                for text, start, end in map(fields, raw)
+                if (stripped := text.strip())
+            ]
         else:
             # Fallback: create single segment from full text
             text = response.text if hasattr(response, 'text') else str(response)
-            segments.append(TranscriptSegment(text=text.strip(), start=0, end=0))
+            segments = [TranscriptSegment(text=text.strip(), start=0, end=0)]
 
         logger.info(f"{provider} transcribed {len(segments)} segments")
         return segments
 
     async def _transcribe_local(self, audio_path: Path) -> list[TranscriptSegment]:
         """Transcribe using local faster-whisper (slower, no API cost)."""
-        model = self._get_whisper_model()
-
-        loop = asyncio.get_event_loop()
+        self._get_whisper_model()
+        pipeline = self._whisper_batched or self._whisper_model
+        # batch_size only exists on the batched pipeline
+        extra = (
+            {"batch_size": self.config.whisper.batch_size}
+            if self._whisper_batched is not None
+            else {}
+        )
 
-        def run_transcription():
-            segments, info = model.transcribe(
-                str(audio_path),
-                beam_size=5,
-                word_timestamps=True,
-            )
-            return list(segments), info
+        # Use PCM decoded during download when available (no file read)
+        audio = self._decoded_audio.pop(audio_path, None)
+        source = audio if audio is not None else str(audio_path)
 
-        segments_raw, info = await loop.run_in_executor(None, run_transcription)
+        loop = asyncio.get_running_loop()
 
-        segments = [
-            TranscriptSegment(
-                text=seg.text.strip(),
-                start=seg.start,
-                end=seg.end,
+        def run_transcription():
+            # Segment-level timestamps are all the soundbite matcher
+            # needs, so word_timestamps stays off. Greedy decoding
+            # (beam_size=1) is several times faster than beam=5 with no
+            # meaningful accuracy loss on podcast speech, and trimming
+            # silences >=500ms skips the dead air between speakers.
+            raw, info = pipeline.transcribe(
+                source,
+                beam_size=1,
+                vad_filter=True,
+                vad_parameters={"min_silence_duration_ms": 500},
+                word_timestamps=False,
+                **extra,
             )
-            for seg in segments_raw
-            if seg.text.strip()
-        ]
+            # Convert while consuming the lazy generator: each bulky
+            # native Segment is GC'd right after its compact
+            # TranscriptSegment is built, instead of materializing
+            # thousands of them first
+            return [
+                TranscriptSegment(text=text, start=seg.start, end=seg.end)
+                for seg in raw
+                if (text := seg.text.strip())
+            ], info
+
+        segments, info = await loop.run_in_executor(self._whisper_pool, run_transcription)
+        self._touch_whisper_model()
 
         logger.info(f"Local transcribed {len(segments)} segments")
         return segments
@@ -1017,13 +1687,22 @@ class PodcastProcessor:
         """Match soundbite texts to their timestamps in the transcript."""
         soundbites = []
 
+        # Casefold each segment once, not once per soundbite lookup,
+        # and build a token -> segment-indices posting map so lookups
+        # intersect small sets instead of scanning every segment
+        lowered = [seg.text.casefold() for seg in segments]
+        token_index: dict[str, set[int]] = defaultdict(set)
+        for i, seg_text in enumerate(lowered):
+            for token in seg_text.split():
+                token_index[token].add(i)
+
         for sb_data in soundbite_texts:
             text = sb_data.get("text", "")
             speaker = sb_data.get("speaker")
             context = sb_data.get("context")
 
             # Find the timestamp by matching text to segments
-            timestamp = self._find_timestamp_for_text(segments, text)
+            timestamp = self._find_timestamp_for_text(segments, lowered, token_index, text)
 
             soundbites.append(
                 Soundbite(
@@ -1039,17 +1718,36 @@ class PodcastProcessor:
     def _find_timestamp_for_text(
         self,
         segments: list[TranscriptSegment],
+        lowered_texts: list[str],
+        token_index: dict[str, set[int]],
         text: str,
     ) -> Optional[str]:
-        """Find the timestamp where a piece of text appears."""
+        """Find the timestamp where a piece of text appears.
+
+        lowered_texts and token_index are computed once by the caller
+        and shared across lookups. The posting-set intersection narrows
+        candidates in O(words); a linear scan only runs when the index
+        has no exact-token hit (quotes cut mid-word, punctuation).
+        """
         # Normalize the search text
-        search_text = text.lower().strip()
-        words = search_text.split()[:5]  # Use first 5 words for matching
+        words = text.casefold().strip().split()[:5]  # First 5 words for matching
+        if not words:
+            return None
 
-        for seg in segments:
-            seg_text = seg.text.lower()
-            # Check if the segment contains the start of the quote
-            if all(word in seg_text for word in words):
+        postings = [token_index.get(word) for word in words]
+        if all(postings):
+            candidates = set.intersection(*postings)
+            for i in sorted(candidates):
+                seg_text = lowered_texts[i]
+                if all(word in seg_text for word in words):
+                    return segments[i].timestamp
+
+        # Fallback: substring scan (tolerates partial-word matches)
+        first = words[0]
+        rest = words[1:]
+        for seg, seg_text in zip(segments, lowered_texts):
+            # Cheap C-level reject on the first word before checking the rest
+            if first in seg_text and all(word in seg_text for word in rest):
                 return seg.timestamp
 
         return None
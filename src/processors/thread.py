@@ -1,5 +1,6 @@
 """X/Twitter thread scraping and processing."""
 
+import asyncio
 import hashlib
 import logging
 import re
@@ -15,6 +16,11 @@ from src.storage.vault import ThreadMetadata, VaultWriter
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once instead of per call
+# Nitter uses class="tweet-content media-body"
+_CONTENT_RE = re.compile(r'<div class="tweet-content[^"]*"[^>]*>(.*?)</div>', re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 @dataclass
 class ThreadResult:
@@ -43,24 +49,49 @@ class ThreadProcessor:
         self.vault = vault
         self._summarizer = None
         self._embedder = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazy create the shared HTTP client.
+
+        A single pooled client reuses connections (and HTTP/2 streams)
+        across Nitter probes instead of paying a TCP + TLS handshake
+        per request.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                headers={"User-Agent": "Mozilla/5.0 (compatible; KnowledgeBot/1.0)"},
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(connect=3.0, read=8.0, write=5.0, pool=5.0),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (called on shutdown)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
     def _get_summarizer(self):
         """Lazy load Claude summarizer."""
         if self._summarizer is None:
-            from src.ai.summarizer import Summarizer
-            self._summarizer = Summarizer(self.config)
+            from src.ai.summarizer import get_summarizer
+            self._summarizer = get_summarizer(self.config)
         return self._summarizer
 
     def _get_embedder(self):
         """Lazy load embedder."""
         if self._embedder is None:
-            from src.ai.embeddings import Embedder
-            self._embedder = Embedder()
+            from src.ai.embeddings import get_embedder
+            self._embedder = get_embedder()
         return self._embedder
 
     async def process(self, url: str) -> ThreadResult:
         """Process an X/Twitter thread URL end-to-end."""
-        item_id = hashlib.md5(url.encode()).hexdigest()[:8]
+        # blake2b matches the other processors' IDs and is ~3x faster
+        # than md5 for the same 8-hex-char output
+        item_id = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
 
         # Step 1: Extract thread
         tweets, metadata = await self._extract_thread(url)
@@ -76,18 +107,25 @@ class ThreadProcessor:
         )
 
         # Step 3: Generate embedding and find connections
+        # embed_async batches with any other threads being processed
+        # concurrently and keeps the encode off the event loop
         full_text = " ".join(tweets)
         embedder = self._get_embedder()
-        embedding = embedder.embed(summary_result["summary"] + " " + full_text[:2000])
+        embedding = await embedder.embed_async(
+            summary_result["summary"] + " " + full_text[:2000]
+        )
 
         from src.storage.vectors import VectorStore
         vector_store = VectorStore(self.config.obsidian.vault_path / ".vectors.db")
-        similar = vector_store.find_similar(embedding, top_k=5, exclude_id=item_id)
+        # Relevance threshold applied inside the store's scan
+        similar = vector_store.find_similar(
+            embedding, top_k=5, exclude_id=item_id, min_score=0.5
+        )
 
-        connections = []
-        for cv, score in similar:
-            if score > 0.5:
-                connections.append(f"[[{cv.vault_path}|{cv.title}]] (similarity: {score:.2f})")
+        connections = [
+            f"[[{cv.vault_path}|{cv.title}]] (similarity: {score:.2f})"
+            for cv, score in similar
+        ]
 
         # Step 4: Save to vault
         vault_path = self.vault.save_thread(
@@ -171,32 +209,29 @@ class ThreadProcessor:
         username = path_parts[0]
         status_id = path_parts[2]
 
+        # Probe every instance concurrently and take the first success:
+        # end-to-end latency is the fastest healthy instance, not the sum
+        # of timeouts of every dead one
+        tasks = [
+            asyncio.create_task(self._try_nitter(instance, username, status_id))
+            for instance in self.NITTER_INSTANCES
+        ]
+
         tweets = []
         last_error = None
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for instance in self.NITTER_INSTANCES:
+        try:
+            for future in asyncio.as_completed(tasks, timeout=15):
                 try:
-                    nitter_url = f"https://{instance}/{username}/status/{status_id}"
-                    logger.info(f"Trying Nitter instance: {instance}")
-
-                    response = await client.get(
-                        nitter_url,
-                        follow_redirects=True,
-                        headers={
-                            "User-Agent": "Mozilla/5.0 (compatible; KnowledgeBot/1.0)"
-                        },
-                    )
-
-                    if response.status_code == 200:
-                        tweets = self._parse_nitter_html(response.text)
-                        if tweets:
-                            break
-
+                    tweets = await future
+                    break
                 except Exception as e:
                     last_error = e
-                    logger.debug(f"Instance {instance} failed: {e}")
-                    continue
+                    logger.debug(f"Nitter instance failed: {e}")
+        except asyncio.TimeoutError:
+            logger.debug("Nitter probes timed out")
+        finally:
+            for task in tasks:
+                task.cancel()
 
         if not tweets:
             if last_error:
@@ -212,14 +247,50 @@ class ThreadProcessor:
 
         return tweets, metadata
 
+    async def _try_nitter(self, instance: str, username: str, status_id: str) -> list[str]:
+        """Fetch and parse a thread from one Nitter instance.
+
+        Raises on any failure so as_completed callers can move on to the
+        next instance.
+        """
+        nitter_url = f"https://{instance}/{username}/status/{status_id}"
+        logger.info(f"Trying Nitter instance: {instance}")
+
+        response = await self._get_client().get(nitter_url)
+        if response.status_code != 200:
+            raise ValueError(f"{instance} returned HTTP {response.status_code}")
+
+        tweets = self._parse_nitter_html(response.text)
+        if not tweets:
+            raise ValueError(f"No tweets parsed from {instance}")
+        return tweets
+
     def _parse_nitter_html(self, html: str) -> list[str]:
-        """Parse tweets from Nitter HTML."""
+        """Parse tweets from Nitter HTML.
+
+        Uses selectolax (C-based HTML parser) when available — a real
+        parse tolerates attribute-order and nesting variations the regex
+        approach silently misses. Falls back to regex extraction.
+        """
+        try:
+            from selectolax.parser import HTMLParser
+        except ImportError:
+            return self._parse_nitter_html_regex(html)
+
+        tweets = []
+        for node in HTMLParser(html).css("div.tweet-content"):
+            text = " ".join(node.text(deep=True, separator=" ").split())
+            if text and len(text) > 5:
+                tweets.append(text)
+
+        return tweets
+
+    def _parse_nitter_html_regex(self, html: str) -> list[str]:
+        """Regex fallback for when selectolax isn't installed."""
         tweets = []
 
         # Find tweet content divs
-        # Nitter uses class="tweet-content media-body"
-        content_pattern = r'<div class="tweet-content[^"]*"[^>]*>(.*?)</div>'
-        matches = re.findall(content_pattern, html, re.DOTALL)
+        matches = _CONTENT_RE.findall(html)
 
         for match in matches:
             # Clean up HTML
@@ -230,18 +301,20 @@ class ThreadProcessor:
         return tweets
 
     def _clean_html(self, html: str) -> str:
-        """Remove HTML tags and clean up text."""
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", html)
-
-        # Decode HTML entities
-        import html as html_lib
-        text = html_lib.unescape(text)
-
-        # Clean up whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        """Remove HTML tags, decode entities, and clean up whitespace."""
+        try:
+            from selectolax.parser import HTMLParser
+        except ImportError:
+            # Fallback: strip tags, then decode entities
+            text = _TAG_RE.sub("", html)
+            import html as html_lib
+            text = html_lib.unescape(text)
+        else:
+            # One C-level pass strips tags and decodes entities
+            text = HTMLParser(html).text(separator=" ")
+
+        # str.split collapses all whitespace without another regex pass
+        return " ".join(text.split())
 
     async def _extract_direct(self, url: str) -> tuple[list[str], ThreadMetadata]:
         """Direct extraction fallback (limited, single tweet only)."""
@@ -255,30 +328,29 @@ class ThreadProcessor:
         username = path_parts[0]
 
         # Try to fetch with oembed API (gives at least the main tweet)
-        async with httpx.AsyncClient() as client:
-            oembed_url = f"https://publish.twitter.com/oembed?url={url}"
-
-            try:
-                response = await client.get(oembed_url)
-                if response.status_code == 200:
-                    data = response.json()
-                    html = data.get("html", "")
-                    # Extract text from the oembed HTML
-                    text = self._clean_html(html)
-                    if text:
-                        # This will only get the first tweet, but better than nothing
-                        tweets = [text]
-
-                        metadata = ThreadMetadata(
-                            author=username,
-                            date=datetime.now().strftime("%Y-%m-%d"),
-                            url=url,
-                            tweet_count=1,
-                        )
-
-                        return tweets, metadata
-            except Exception as e:
-                logger.warning(f"oembed fallback failed: {e}")
+        oembed_url = f"https://publish.twitter.com/oembed?url={url}"
+
+        try:
+            response = await self._get_client().get(oembed_url)
+            if response.status_code == 200:
+                data = response.json()
+                html = data.get("html", "")
+                # Extract text from the oembed HTML
+                text = self._clean_html(html)
+                if text:
+                    # This will only get the first tweet, but better than nothing
+                    tweets = [text]
+
+                    metadata = ThreadMetadata(
+                        author=username,
+                        date=datetime.now().strftime("%Y-%m-%d"),
+                        url=url,
+                        tweet_count=1,
+                    )
+
+                    return tweets, metadata
+        except Exception as e:
+            logger.warning(f"oembed fallback failed: {e}")
 
         raise ValueError(
             "Could not extract thread. Nitter instances may be unavailable. "
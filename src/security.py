@@ -1,10 +1,13 @@
 """Security utilities for Knowledge Bot."""
 
+import asyncio
+import bisect
 import ipaddress
 import logging
 import os
 import re
 import socket
+import time
 from functools import wraps
 from typing import Callable
 from urllib.parse import urlparse
@@ -37,57 +40,171 @@ BLOCKED_HOSTNAMES = [
     "169.254.169.254",
 ]
 
+# Set lookup for blocked-hostname suffixes: checking each dot-suffix of a
+# hostname against this is O(labels) rather than O(blocklist)
+_BLOCKED_SUFFIXES = frozenset(BLOCKED_HOSTNAMES)
 
-def validate_url(url: str) -> tuple[bool, str]:
-    """Validate a URL is safe to fetch.
 
-    Returns (is_valid, error_message).
+def _build_range_index(
+    ranges: list[ipaddress.IPv4Network | ipaddress.IPv6Network],
+    version: int,
+) -> tuple[list[int], list[int]]:
+    """Sorted (starts, ends) integer bounds for one address family.
+
+    The ranges don't overlap, so a bisect on the starts plus one end
+    comparison answers membership in O(log N).
+    """
+    bounds = sorted(
+        (int(net.network_address), int(net.broadcast_address))
+        for net in ranges
+        if net.version == version
+    )
+    return [start for start, _ in bounds], [end for _, end in bounds]
+
+
+_BLOCKED_V4_STARTS, _BLOCKED_V4_ENDS = _build_range_index(BLOCKED_IP_RANGES, 4)
+_BLOCKED_V6_STARTS, _BLOCKED_V6_ENDS = _build_range_index(BLOCKED_IP_RANGES, 6)
+
+
+def _ip_blocked(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    """Check an address against the blocked ranges via binary search."""
+    if ip.version == 4:
+        starts, ends = _BLOCKED_V4_STARTS, _BLOCKED_V4_ENDS
+    else:
+        starts, ends = _BLOCKED_V6_STARTS, _BLOCKED_V6_ENDS
+    value = int(ip)
+    i = bisect.bisect_right(starts, value) - 1
+    return i >= 0 and value <= ends[i]
+
+
+# Sanitizer patterns, compiled once at import time
+_APIKEY_RE = re.compile(r"sk-[a-zA-Z0-9-]+")
+_TOKEN_RE = re.compile(r"\b[0-9]+:[A-Za-z0-9_-]+\b")
+_PATH_RE = re.compile(r"/[^\s]+/")
+_LINE_RE = re.compile(r"line \d+")
+_SEP_RE = re.compile(r"[/\\]")
+_DOTDOT_RE = re.compile(r"\.\.+")
+_UNSAFE_RE = re.compile(r'[<>:"|?*\x00-\x1f]')
+_WS_RE = re.compile(r"\s+")
+
+# DNS validation results cached per hostname so repeated submissions for
+# the same host skip the resolver (a blocking query can take tens of ms)
+_DNS_CACHE_TTL = 300  # seconds
+_DNS_CACHE_MAX = 1024
+# hostname -> (expires_at, (is_valid, error_message))
+_dns_cache: dict[str, tuple[float, tuple[bool, str]]] = {}
+
+
+def _precheck_url(url: str) -> tuple[str | None, str]:
+    """Scheme and hostname checks shared by the sync and async validators.
+
+    Returns (hostname, "") when the URL passes, (None, error_message) otherwise.
     """
     try:
         parsed = urlparse(url)
     except Exception:
-        return False, "Invalid URL format"
+        return None, "Invalid URL format"
 
     # Check scheme
     if parsed.scheme not in ("http", "https"):
-        return False, "Only HTTP/HTTPS URLs are allowed"
+        return None, "Only HTTP/HTTPS URLs are allowed"
 
     # Check hostname exists
     hostname = parsed.hostname
     if not hostname:
-        return False, "URL must have a hostname"
+        return None, "URL must have a hostname"
+
+    # Check blocked hostnames: the hostname itself and every dot-suffix
+    # (so "evil.localhost" matches "localhost")
+    labels = hostname.lower().split(".")
+    for k in range(len(labels)):
+        if ".".join(labels[k:]) in _BLOCKED_SUFFIXES:
+            return None, f"Access to {hostname} is blocked"
+
+    return hostname, ""
+
+
+def _cached_dns_result(hostname: str) -> tuple[bool, str] | None:
+    """Return a cached validation result for hostname, or None if stale/missing."""
+    cached = _dns_cache.get(hostname)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _cache_dns_result(hostname: str, result: tuple[bool, str]) -> None:
+    """Record a validation result with a TTL, bounding cache size."""
+    if len(_dns_cache) >= _DNS_CACHE_MAX:
+        _dns_cache.clear()
+    _dns_cache[hostname] = (time.monotonic() + _DNS_CACHE_TTL, result)
+
+
+def _check_resolved_ips(addr_info) -> tuple[bool, str]:
+    """Check resolved addresses against the blocked IP ranges."""
+    for family, _, _, _, sockaddr in addr_info:
+        try:
+            ip = ipaddress.ip_address(sockaddr[0])
+        except ValueError:
+            continue
+        if _ip_blocked(ip):
+            return False, "Access to internal/private IPs is blocked"
+    return True, ""
+
+
+def validate_url(url: str) -> tuple[bool, str]:
+    """Validate a URL is safe to fetch.
+
+    Returns (is_valid, error_message).
+    """
+    hostname, error = _precheck_url(url)
+    if hostname is None:
+        return False, error
 
-    # Check blocked hostnames
-    hostname_lower = hostname.lower()
-    for blocked in BLOCKED_HOSTNAMES:
-        if hostname_lower == blocked or hostname_lower.endswith(f".{blocked}"):
-            return False, f"Access to {hostname} is blocked"
+    cached = _cached_dns_result(hostname)
+    if cached is not None:
+        return cached
 
-    # Resolve hostname and check IP
+    # Resolve hostname and check IPs
     try:
-        # Get all IPs for the hostname
         addr_info = socket.getaddrinfo(hostname, None)
-        for family, _, _, _, sockaddr in addr_info:
-            ip_str = sockaddr[0]
-            try:
-                ip = ipaddress.ip_address(ip_str)
-                for blocked_range in BLOCKED_IP_RANGES:
-                    if ip in blocked_range:
-                        return False, f"Access to internal/private IPs is blocked"
-            except ValueError:
-                continue
     except socket.gaierror:
         return False, f"Could not resolve hostname: {hostname}"
 
-    return True, ""
+    result = _check_resolved_ips(addr_info)
+    _cache_dns_result(hostname, result)
+    return result
+
+
+async def async_validate_url(url: str) -> tuple[bool, str]:
+    """Async variant of validate_url that resolves DNS off the event loop.
+
+    Same checks and return shape as validate_url; preferred from async
+    handlers so a slow resolver doesn't block other updates.
+    """
+    hostname, error = _precheck_url(url)
+    if hostname is None:
+        return False, error
+
+    cached = _cached_dns_result(hostname)
+    if cached is not None:
+        return cached
+
+    try:
+        addr_info = await asyncio.get_running_loop().getaddrinfo(hostname, None)
+    except socket.gaierror:
+        return False, f"Could not resolve hostname: {hostname}"
+
+    result = _check_resolved_ips(addr_info)
+    _cache_dns_result(hostname, result)
+    return result
 
 
 def sanitize_for_logging(text: str, max_length: int = 100) -> str:
     """Sanitize text for safe logging (remove sensitive patterns)."""
     # Remove potential API keys
-    text = re.sub(r"sk-[a-zA-Z0-9-]+", "[REDACTED]", text)
+    text = _APIKEY_RE.sub("[REDACTED]", text)
     # Remove potential tokens
-    text = re.sub(r"\b[0-9]+:[A-Za-z0-9_-]+\b", "[REDACTED]", text)
+    text = _TOKEN_RE.sub("[REDACTED]", text)
     # Truncate
     if len(text) > max_length:
         text = text[:max_length] + "..."
@@ -99,9 +216,9 @@ def sanitize_error_message(error: Exception) -> str:
     error_str = str(error)
 
     # Remove file paths
-    error_str = re.sub(r"/[^\s]+/", "[path]/", error_str)
+    error_str = _PATH_RE.sub("[path]/", error_str)
     # Remove line numbers
-    error_str = re.sub(r"line \d+", "line [N]", error_str)
+    error_str = _LINE_RE.sub("line [N]", error_str)
     # Truncate
     if len(error_str) > 200:
         error_str = error_str[:200] + "..."
@@ -118,12 +235,12 @@ def sanitize_path_component(name: str) -> str:
     # Remove null bytes
     name = name.replace("\x00", "")
     # Remove path separators and parent directory references
-    name = re.sub(r"[/\\]", "", name)
-    name = re.sub(r"\.\.+", ".", name)
+    name = _SEP_RE.sub("", name)
+    name = _DOTDOT_RE.sub(".", name)
     # Remove other problematic characters
-    name = re.sub(r'[<>:"|?*\x00-\x1f]', "", name)
+    name = _UNSAFE_RE.sub("", name)
     # Replace whitespace with dashes
-    name = re.sub(r"\s+", "-", name)
+    name = _WS_RE.sub("-", name)
     # Limit length
     name = name[:50]
     # Remove leading/trailing dots and dashes
@@ -1,12 +1,20 @@
 """Hierarchical folder/category storage for podcast summaries."""
 
 import json
+import os
+import threading
 import uuid
-from dataclasses import dataclass, asdict, field
+
+import orjson
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# How long a mutation waits for others to coalesce before writing
+_FLUSH_DELAY = 0.2  # seconds
+
 
 @dataclass
 class Category:
@@ -16,42 +24,176 @@ class Category:
     emoji: str
     description: str
     parent_id: Optional[str]
-    summary_ids: list[str]
+    # Set for O(1) membership tests; reorganization batches do a lot of
+    # "is this summary already filed here" checks
+    summary_ids_set: set[str]
     created_at: str
     updated_at: str
 
+    @property
+    def summary_ids(self) -> list[str]:
+        """Stable (sorted) view for display, pagination, and JSON."""
+        return sorted(self.summary_ids_set)
+
 
 class CategoryStorage:
     """Hierarchical category storage with CRUD and tree operations."""
 
-    def __init__(self, storage_path: Path | str):
+    def __init__(self, storage_path: Path | str, durable: bool = False):
         self.storage_path = Path(storage_path)
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self._categories: dict[str, Category] = {}
+        # parent_id -> child category IDs, so child lookups don't scan
+        # every category (None key holds the roots)
+        self._children_index: dict[Optional[str], list[str]] = {}
+        # summary_id -> category IDs containing it, the reverse lookup
+        # for "which folders hold this summary"
+        self._summary_to_cats: dict[str, set[str]] = {}
+        # Built tree from list_tree, reused until the next mutation;
+        # the library view renders it on every /lookup
+        self._tree_cache: Optional[list[dict]] = None
         self._save_count: int = 0
+        # fsync before rename when True; the atomic rename alone already
+        # prevents torn files, so syncing is off by default
+        self._durable = durable
+        # Writes are debounced: mutations mark the store dirty and a
+        # short timer coalesces a burst of ops into one file rewrite.
+        # The lock guards the data too - the timer serializes the
+        # categories on its own thread, so mutators hold it as well
+        # (re-entrant: mutators call _mark_dirty while holding it)
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._in_batch = False
         self._load()
 
     def _load(self) -> None:
         """Load categories from disk."""
         if self.storage_path.exists():
             try:
-                with open(self.storage_path) as f:
-                    data = json.load(f)
-                    self._save_count = data.get("save_count", 0)
-                    for item in data.get("categories", []):
-                        cat = Category(**item)
-                        self._categories[cat.id] = cat
-            except (json.JSONDecodeError, KeyError, TypeError):
+                data = orjson.loads(self.storage_path.read_bytes())
+                self._save_count = data.get("save_count", 0)
+                for item in data.get("categories", []):
+                    item["summary_ids_set"] = set(item.pop("summary_ids", []))
+                    cat = Category(**item)
+                    self._categories[cat.id] = cat
+            except (orjson.JSONDecodeError, KeyError, TypeError):
                 self._categories = {}
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Build the parent->children and summary->categories indexes."""
+        children: dict[Optional[str], list[str]] = {}
+        summary_to_cats: dict[str, set[str]] = {}
+        for cat in self._categories.values():
+            children.setdefault(cat.parent_id, []).append(cat.id)
+            for sid in cat.summary_ids_set:
+                summary_to_cats.setdefault(sid, set()).add(cat.id)
+        self._children_index = children
+        self._summary_to_cats = summary_to_cats
+
+    def _file_summary(self, summary_id: str, category_id: str) -> None:
+        """Record summary membership in the reverse index."""
+        self._summary_to_cats.setdefault(summary_id, set()).add(category_id)
+
+    def _unfile_summary(self, summary_id: str, category_id: str) -> None:
+        """Drop summary membership from the reverse index."""
+        cats = self._summary_to_cats.get(summary_id)
+        if cats is not None:
+            cats.discard(category_id)
+            if not cats:
+                del self._summary_to_cats[summary_id]
+
+    def _index_child(self, cat: Category) -> None:
+        """Record cat under its current parent in the index."""
+        self._children_index.setdefault(cat.parent_id, []).append(cat.id)
+
+    def _unindex_child(self, cat: Category) -> None:
+        """Drop cat from its current parent's entry in the index."""
+        siblings = self._children_index.get(cat.parent_id)
+        if siblings and cat.id in siblings:
+            siblings.remove(cat.id)
+
+    def _category_to_dict(self, cat: Category) -> dict:
+        """JSON-ready form: summary_ids as a sorted list, not a set."""
+        return {
+            "id": cat.id,
+            "name": cat.name,
+            "emoji": cat.emoji,
+            "description": cat.description,
+            "parent_id": cat.parent_id,
+            "summary_ids": cat.summary_ids,
+            "created_at": cat.created_at,
+            "updated_at": cat.updated_at,
+        }
 
     def _save(self) -> None:
-        """Save categories to disk."""
-        data = {
+        """Save categories to disk (write-to-temp + atomic rename).
+
+        orjson writes compact JSON; the human-readable pretty form lives
+        in the markdown export instead.
+        """
+        payload = orjson.dumps({
             "save_count": self._save_count,
-            "categories": [asdict(c) for c in self._categories.values()],
-        }
-        with open(self.storage_path, 'w') as f:
-            json.dump(data, f, indent=2)
+            "categories": [
+                self._category_to_dict(c) for c in self._categories.values()
+            ],
+        })
+        tmp_path = self.storage_path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            if self._durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.storage_path)
+
+    def _mark_dirty(self) -> None:
+        """Record a pending change and schedule a coalesced write."""
+        # Any mutation can change tree structure or folder counts
+        self._tree_cache = None
+        with self._lock:
+            self._dirty = True
+            if self._in_batch or self._flush_timer is not None:
+                return
+            timer = threading.Timer(_FLUSH_DELAY, self._flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def _flush(self) -> None:
+        """Timer callback: write if still dirty."""
+        with self._lock:
+            self._flush_timer = None
+            # Clear the flag only after a successful write so a failed
+            # save is retried by the next flush
+            if self._dirty and not self._in_batch:
+                self._save()
+                self._dirty = False
+
+    def flush(self) -> None:
+        """Write any pending changes immediately (call on shutdown)."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    @contextmanager
+    def _batch(self):
+        """Suppress intermediate writes inside the block; flush once on exit."""
+        with self._lock:
+            self._in_batch = True
+            # A timer armed before the batch must not fire mid-batch
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        try:
+            yield
+        finally:
+            self._in_batch = False
+            self.flush()
 
     def create_category(
         self,
@@ -80,13 +222,15 @@ class CategoryStorage:
             emoji=emoji,
             description=description,
             parent_id=parent_id,
-            summary_ids=[],
+            summary_ids_set=set(),
             created_at=now,
             updated_at=now,
         )
 
-        self._categories[cat_id] = category
-        self._save()
+        with self._lock:
+            self._categories[cat_id] = category
+            self._index_child(category)
+            self._mark_dirty()
         return cat_id
 
     def add_summary(self, summary_id: str, category_id: str) -> bool:
@@ -95,10 +239,12 @@ class CategoryStorage:
             return False
 
         cat = self._categories[category_id]
-        if summary_id not in cat.summary_ids:
-            cat.summary_ids.append(summary_id)
-            cat.updated_at = datetime.now().isoformat()
-            self._save()
+        if summary_id not in cat.summary_ids_set:
+            with self._lock:
+                cat.summary_ids_set.add(summary_id)
+                self._file_summary(summary_id, category_id)
+                cat.updated_at = datetime.now().isoformat()
+                self._mark_dirty()
         return True
 
     def remove_summary(self, summary_id: str, category_id: Optional[str] = None) -> bool:
@@ -106,14 +252,16 @@ class CategoryStorage:
         removed = False
         targets = [self._categories[category_id]] if category_id else self._categories.values()
 
-        for cat in targets:
-            if summary_id in cat.summary_ids:
-                cat.summary_ids.remove(summary_id)
-                cat.updated_at = datetime.now().isoformat()
-                removed = True
+        with self._lock:
+            for cat in targets:
+                if summary_id in cat.summary_ids_set:
+                    cat.summary_ids_set.discard(summary_id)
+                    self._unfile_summary(summary_id, cat.id)
+                    cat.updated_at = datetime.now().isoformat()
+                    removed = True
 
-        if removed:
-            self._save()
+            if removed:
+                self._mark_dirty()
         return removed
 
     def move_summary(self, summary_id: str, from_id: str, to_id: str) -> bool:
@@ -124,61 +272,67 @@ class CategoryStorage:
         from_cat = self._categories[from_id]
         to_cat = self._categories[to_id]
 
-        if summary_id not in from_cat.summary_ids:
+        if summary_id not in from_cat.summary_ids_set:
             return False
 
-        from_cat.summary_ids.remove(summary_id)
-        if summary_id not in to_cat.summary_ids:
-            to_cat.summary_ids.append(summary_id)
-
-        now = datetime.now().isoformat()
-        from_cat.updated_at = now
-        to_cat.updated_at = now
-        self._save()
+        with self._lock:
+            from_cat.summary_ids_set.discard(summary_id)
+            self._unfile_summary(summary_id, from_id)
+            if summary_id not in to_cat.summary_ids_set:
+                to_cat.summary_ids_set.add(summary_id)
+                self._file_summary(summary_id, to_id)
+
+            now = datetime.now().isoformat()
+            from_cat.updated_at = now
+            to_cat.updated_at = now
+            self._mark_dirty()
         return True
 
     def list_tree(self) -> list[dict]:
         """Return the full category tree as a nested structure.
 
-        Returns list of top-level categories, each with a 'children' list.
+        Returns list of top-level categories, each with a 'children'
+        list. The built tree is cached until the next mutation.
         """
-        tree = []
-        # Get top-level categories
-        roots = [c for c in self._categories.values() if c.parent_id is None]
-        roots.sort(key=lambda c: c.name)
+        if self._tree_cache is not None:
+            return self._tree_cache
 
-        for root in roots:
+        tree = []
+        for root in self.list_root_categories():
             children = self.get_children(root.id)
-            children.sort(key=lambda c: c.name)
             tree.append({
                 "id": root.id,
                 "name": root.name,
                 "emoji": root.emoji,
                 "description": root.description,
-                "count": len(root.summary_ids),
+                "count": len(root.summary_ids_set),
                 "children": [
                     {
                         "id": child.id,
                         "name": child.name,
                         "emoji": child.emoji,
                         "description": child.description,
-                        "count": len(child.summary_ids),
+                        "count": len(child.summary_ids_set),
                     }
                     for child in children
                 ],
             })
 
+        self._tree_cache = tree
         return tree
 
     def list_root_categories(self) -> list[Category]:
         """Get top-level categories only."""
-        roots = [c for c in self._categories.values() if c.parent_id is None]
+        roots = [self._categories[cid] for cid in self._children_index.get(None, ())]
         roots.sort(key=lambda c: c.name)
         return roots
 
     def get_children(self, category_id: str) -> list[Category]:
         """Get sub-folders of a category."""
-        children = [c for c in self._categories.values() if c.parent_id == category_id]
+        children = [
+            self._categories[cid]
+            for cid in self._children_index.get(category_id, ())
+        ]
         children.sort(key=lambda c: c.name)
         return children
 
@@ -192,11 +346,12 @@ class CategoryStorage:
             return False
 
         cat = self._categories[category_id]
-        cat.name = new_name
-        if new_emoji is not None:
-            cat.emoji = new_emoji
-        cat.updated_at = datetime.now().isoformat()
-        self._save()
+        with self._lock:
+            cat.name = new_name
+            if new_emoji is not None:
+                cat.emoji = new_emoji
+            cat.updated_at = datetime.now().isoformat()
+            self._mark_dirty()
         return True
 
     def move_category(self, category_id: str, new_parent_id: Optional[str]) -> bool:
@@ -221,9 +376,12 @@ class CategoryStorage:
         if new_parent_id and self.get_children(category_id):
             return False
 
-        cat.parent_id = new_parent_id
-        cat.updated_at = datetime.now().isoformat()
-        self._save()
+        with self._lock:
+            self._unindex_child(cat)
+            cat.parent_id = new_parent_id
+            self._index_child(cat)
+            cat.updated_at = datetime.now().isoformat()
+            self._mark_dirty()
         return True
 
     def delete_category(self, category_id: str) -> list[str]:
@@ -237,28 +395,39 @@ class CategoryStorage:
         cat = self._categories[category_id]
         orphaned = []
 
-        # Move summaries to parent category if one exists
-        if cat.parent_id and cat.parent_id in self._categories:
-            parent = self._categories[cat.parent_id]
-            for sid in cat.summary_ids:
-                if sid not in parent.summary_ids:
-                    parent.summary_ids.append(sid)
-            parent.updated_at = datetime.now().isoformat()
-        else:
-            orphaned = list(cat.summary_ids)
-
-        # Re-parent children to this category's parent
-        for child in self.get_children(category_id):
-            child.parent_id = cat.parent_id
-            child.updated_at = datetime.now().isoformat()
-
-        del self._categories[category_id]
-        self._save()
+        with self._lock:
+            # Move summaries to parent category if one exists
+            if cat.parent_id and cat.parent_id in self._categories:
+                parent = self._categories[cat.parent_id]
+                for sid in cat.summary_ids_set:
+                    self._unfile_summary(sid, category_id)
+                    if sid not in parent.summary_ids_set:
+                        parent.summary_ids_set.add(sid)
+                        self._file_summary(sid, parent.id)
+                parent.updated_at = datetime.now().isoformat()
+            else:
+                orphaned = cat.summary_ids
+                for sid in orphaned:
+                    self._unfile_summary(sid, category_id)
+
+            # Re-parent children to this category's parent
+            for child in self.get_children(category_id):
+                self._unindex_child(child)
+                child.parent_id = cat.parent_id
+                self._index_child(child)
+                child.updated_at = datetime.now().isoformat()
+
+            self._unindex_child(cat)
+            del self._categories[category_id]
+            self._mark_dirty()
         return orphaned
 
     def get_categories_for_summary(self, summary_id: str) -> list[Category]:
         """Get all categories containing a summary."""
-        return [c for c in self._categories.values() if summary_id in c.summary_ids]
+        return [
+            self._categories[cid]
+            for cid in self._summary_to_cats.get(summary_id, ())
+        ]
 
     def find_by_name(self, name: str) -> list[Category]:
         """Fuzzy match categories by name (case-insensitive substring)."""
@@ -271,16 +440,14 @@ class CategoryStorage:
 
     def get_uncategorized_summaries(self, all_summary_ids: list[str]) -> list[str]:
         """Get summary IDs that aren't in any category."""
-        categorized = set()
-        for cat in self._categories.values():
-            categorized.update(cat.summary_ids)
-        return [sid for sid in all_summary_ids if sid not in categorized]
+        return [sid for sid in all_summary_ids if sid not in self._summary_to_cats]
 
     def increment_save_count(self) -> int:
         """Increment and return the save counter (for triggering reorganization)."""
-        self._save_count += 1
-        self._save()
-        return self._save_count
+        with self._lock:
+            self._save_count += 1
+            self._mark_dirty()
+            return self._save_count
 
     def get_save_count(self) -> int:
         """Get the current save count."""
@@ -366,7 +533,10 @@ class CategoryStorage:
         lines.append("## All Categories (JSON backup)")
         lines.append("")
         lines.append("```json")
-        lines.append(json.dumps([asdict(c) for c in self._categories.values()], indent=2))
+        lines.append(json.dumps(
+            [self._category_to_dict(c) for c in self._categories.values()],
+            indent=2,
+        ))
         lines.append("```")
 
         export_path.write_text("\n".join(lines))
@@ -385,62 +555,74 @@ class CategoryStorage:
         """
         changes = []
 
-        for op in operations:
-            try:
-                if op["op"] == "merge":
-                    source = self._categories.get(op["source_id"])
-                    target = self._categories.get(op["target_id"])
-                    if source and target:
-                        # Move all summaries from source to target
-                        for sid in source.summary_ids:
-                            if sid not in target.summary_ids:
-                                target.summary_ids.append(sid)
-                        target.updated_at = datetime.now().isoformat()
-                        # Re-parent source's children to target
-                        for child in self.get_children(source.id):
-                            child.parent_id = target.id
-                        del self._categories[source.id]
-                        changes.append(f"Merged '{source.name}' into '{target.name}'")
-
-                elif op["op"] == "create":
-                    cat_id = self.create_category(
-                        name=op["name"],
-                        emoji=op.get("emoji", ""),
-                        parent_id=op.get("parent_id"),
-                    )
-                    # Move specified summaries into new category
-                    for sid in op.get("summary_ids", []):
-                        self.add_summary(sid, cat_id)
-                        # Remove from old location
-                        for cat in self._categories.values():
-                            if cat.id != cat_id and sid in cat.summary_ids:
-                                cat.summary_ids.remove(sid)
-                    changes.append(f"Created '{op['name']}' with {len(op.get('summary_ids', []))} items")
-
-                elif op["op"] == "move_summaries":
-                    target = self._categories.get(op["to_id"])
-                    if target:
+        # One coalesced write for the whole batch instead of a file
+        # rewrite per operation; the lock is held throughout so a
+        # pending flush can't observe a half-applied reorganization
+        with self._lock, self._batch():
+            for op in operations:
+                try:
+                    if op["op"] == "merge":
+                        source = self._categories.get(op["source_id"])
+                        target = self._categories.get(op["target_id"])
+                        if source and target:
+                            # Move all summaries from source to target
+                            for sid in source.summary_ids_set:
+                                self._unfile_summary(sid, source.id)
+                                if sid not in target.summary_ids_set:
+                                    target.summary_ids_set.add(sid)
+                                    self._file_summary(sid, target.id)
+                            target.updated_at = datetime.now().isoformat()
+                            # Re-parent source's children to target
+                            for child in self.get_children(source.id):
+                                self._unindex_child(child)
+                                child.parent_id = target.id
+                                self._index_child(child)
+                            self._unindex_child(source)
+                            del self._categories[source.id]
+                            changes.append(f"Merged '{source.name}' into '{target.name}'")
+                            self._mark_dirty()
+
+                    elif op["op"] == "create":
+                        cat_id = self.create_category(
+                            name=op["name"],
+                            emoji=op.get("emoji", ""),
+                            parent_id=op.get("parent_id"),
+                        )
+                        # Move specified summaries into new category
                         for sid in op.get("summary_ids", []):
-                            if sid not in target.summary_ids:
-                                target.summary_ids.append(sid)
-                            # Remove from other categories
-                            for cat in self._categories.values():
-                                if cat.id != target.id and sid in cat.summary_ids:
-                                    cat.summary_ids.remove(sid)
-                        changes.append(f"Moved {len(op['summary_ids'])} items to '{target.name}'")
-
-                elif op["op"] == "rename":
-                    cat = self._categories.get(op["category_id"])
-                    if cat:
-                        old_name = cat.name
-                        cat.name = op["name"]
-                        if "emoji" in op:
-                            cat.emoji = op["emoji"]
-                        cat.updated_at = datetime.now().isoformat()
-                        changes.append(f"Renamed '{old_name}' to '{op['name']}'")
-
-            except (KeyError, ValueError) as e:
-                continue
-
-        self._save()
+                            self.add_summary(sid, cat_id)
+                            # Remove from old locations via the reverse index
+                            for cid in self._summary_to_cats.get(sid, set()) - {cat_id}:
+                                self._categories[cid].summary_ids_set.discard(sid)
+                                self._unfile_summary(sid, cid)
+                        changes.append(f"Created '{op['name']}' with {len(op.get('summary_ids', []))} items")
+
+                    elif op["op"] == "move_summaries":
+                        target = self._categories.get(op["to_id"])
+                        if target:
+                            for sid in op.get("summary_ids", []):
+                                if sid not in target.summary_ids_set:
+                                    target.summary_ids_set.add(sid)
+                                    self._file_summary(sid, target.id)
+                                # Remove from other categories via the reverse index
+                                for cid in self._summary_to_cats.get(sid, set()) - {target.id}:
+                                    self._categories[cid].summary_ids_set.discard(sid)
+                                    self._unfile_summary(sid, cid)
+                            changes.append(f"Moved {len(op['summary_ids'])} items to '{target.name}'")
+                            self._mark_dirty()
+
+                    elif op["op"] == "rename":
+                        cat = self._categories.get(op["category_id"])
+                        if cat:
+                            old_name = cat.name
+                            cat.name = op["name"]
+                            if "emoji" in op:
+                                cat.emoji = op["emoji"]
+                            cat.updated_at = datetime.now().isoformat()
+                            changes.append(f"Renamed '{old_name}' to '{op['name']}'")
+                            self._mark_dirty()
+
+                except (KeyError, ValueError) as e:
+                    continue
+
         return changes
@@ -1,12 +1,18 @@
 """Simple JSON-based storage for podcast summaries."""
 
-import json
+import os
 import uuid
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass
+
+import orjson
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# Rewrite the snapshot once the WAL grows past this fraction of its size
+_WAL_COMPACT_RATIO = 0.5
+
 
 @dataclass
 class PodcastSummary:
@@ -30,32 +36,166 @@ class PodcastSummary:
 class SummaryStorage:
     """Simple JSON-based storage for podcast summaries."""
 
-    def __init__(self, storage_path: Path | str):
+    def __init__(self, storage_path: Path | str, durable: bool = False):
         self.storage_path = Path(storage_path)
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self._summaries: dict[str, PodcastSummary] = {}
+        # fsync before rename when True; the atomic rename alone already
+        # prevents torn files, so syncing is off by default
+        self._durable = durable
+        # Write-ahead log: mutations append one small line here instead
+        # of rewriting the whole snapshot (which carries full
+        # transcripts); the snapshot is only rewritten on compaction
+        self._wal_path = self.storage_path.with_suffix(".wal.jsonl")
+        # Cold fields (transcript + email_content) live in one small file
+        # per summary; the index holds only cheap metadata, so metadata
+        # mutations stop rewriting every transcript in the corpus
+        self._bodies_dir = self.storage_path.parent / "summaries"
+        self._hydrated: set[str] = set()
+        # Cache of the most recent summaries (newest first) so the common
+        # lookup path doesn't re-sort the whole collection
+        self._recent: deque[PodcastSummary] = deque(maxlen=10)
         self._load()
+        self._replay_wal()
+        self._rebuild_recent()
+
+    def _body_path(self, summary_id: str) -> Path:
+        return self._bodies_dir / f"{summary_id}.json"
+
+    def _write_body(self, summary: PodcastSummary) -> None:
+        """Write one summary's cold fields to its per-id file."""
+        self._bodies_dir.mkdir(parents=True, exist_ok=True)
+        self._body_path(summary.id).write_bytes(orjson.dumps({
+            "transcript": summary.transcript,
+            "email_content": summary.email_content,
+        }))
+
+    def _hydrate(self, summary: PodcastSummary) -> None:
+        """Fill in the cold fields from the per-id file, once."""
+        if summary.id in self._hydrated:
+            return
+        body_path = self._body_path(summary.id)
+        if body_path.exists():
+            try:
+                body = orjson.loads(body_path.read_bytes())
+                summary.transcript = body.get("transcript", "")
+                summary.email_content = body.get("email_content", "")
+            except orjson.JSONDecodeError:
+                pass
+        self._hydrated.add(summary.id)
+
+    def _metadata(self, summary: PodcastSummary) -> dict:
+        """Cheap fields only — what the index and WAL record."""
+        return {
+            "id": summary.id,
+            "title": summary.title,
+            "show": summary.show,
+            "url": summary.url,
+            "duration": summary.duration,
+            "created_at": summary.created_at,
+            "updated_at": summary.updated_at,
+            "categories": summary.categories,
+        }
+
+    def _ingest_item(self, item: dict) -> PodcastSummary:
+        """Build a summary from a snapshot/WAL dict, old or new format.
+
+        Legacy records carry transcript/email_content inline; migrate
+        those to the per-id body file so the next compaction can drop
+        them from the index.
+        """
+        if "categories" not in item:
+            item["categories"] = []
+        legacy_body = "transcript" in item or "email_content" in item
+        item.setdefault("transcript", "")
+        item.setdefault("email_content", "")
+        summary = PodcastSummary(**item)
+        self._summaries[summary.id] = summary
+        if legacy_body:
+            self._hydrated.add(summary.id)
+            if not self._body_path(summary.id).exists():
+                self._write_body(summary)
+        return summary
 
     def _load(self) -> None:
-        """Load summaries from disk."""
+        """Load the summary index from disk."""
         if self.storage_path.exists():
             try:
-                with open(self.storage_path) as f:
-                    data = json.load(f)
-                    for item in data:
-                        # Backward compat: add categories if missing
-                        if "categories" not in item:
-                            item["categories"] = []
-                        summary = PodcastSummary(**item)
-                        self._summaries[summary.id] = summary
-            except (json.JSONDecodeError, KeyError):
+                data = orjson.loads(self.storage_path.read_bytes())
+                for item in data:
+                    self._ingest_item(item)
+            except (orjson.JSONDecodeError, KeyError):
                 self._summaries = {}
 
     def _save(self) -> None:
-        """Save summaries to disk."""
-        data = [asdict(s) for s in self._summaries.values()]
-        with open(self.storage_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Save the metadata index to disk (write-to-temp + atomic rename).
+
+        Transcripts and email bodies are not rewritten here — they live
+        in the per-id body files and only change when their summary does.
+        """
+        payload = orjson.dumps(
+            [self._metadata(s) for s in self._summaries.values()]
+        )
+        tmp_path = self.storage_path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            if self._durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.storage_path)
+        # The snapshot now contains everything the WAL recorded
+        self._wal_path.unlink(missing_ok=True)
+
+    def _append_wal(self, record: dict) -> None:
+        """Append one mutation to the WAL, compacting when it gets big."""
+        with open(self._wal_path, 'ab') as f:
+            f.write(orjson.dumps(record) + b"\n")
+        try:
+            wal_size = self._wal_path.stat().st_size
+            snap_size = (
+                self.storage_path.stat().st_size
+                if self.storage_path.exists()
+                else 0
+            )
+        except OSError:
+            return
+        if wal_size > max(snap_size, 1) * _WAL_COMPACT_RATIO:
+            self._save()
+
+    def _replay_wal(self) -> None:
+        """Apply WAL entries on top of the loaded snapshot."""
+        if not self._wal_path.exists():
+            return
+        try:
+            with open(self._wal_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = orjson.loads(line)
+                    op = record.get("op")
+                    if op == "upsert":
+                        self._ingest_item(record["summary"])
+                    elif op == "update":
+                        summary = self._summaries.get(record["id"])
+                        if summary:
+                            for key, value in record["fields"].items():
+                                setattr(summary, key, value)
+                    elif op == "delete":
+                        self._summaries.pop(record["id"], None)
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            # A torn trailing line is the expected crash artifact;
+            # everything replayed before it is kept
+            pass
+
+    def _rebuild_recent(self) -> None:
+        """Rebuild the recent-summaries cache from the full collection."""
+        newest_first = sorted(
+            self._summaries.values(),
+            key=lambda s: s.created_at,
+            reverse=True,
+        )
+        self._recent = deque(newest_first[:10], maxlen=10)
 
     def save_summary(
         self,
@@ -84,7 +224,10 @@ class SummaryStorage:
         )
 
         self._summaries[summary_id] = summary
-        self._save()
+        self._hydrated.add(summary_id)
+        self._recent.appendleft(summary)
+        self._write_body(summary)
+        self._append_wal({"op": "upsert", "summary": self._metadata(summary)})
         return summary_id
 
     def update_summary(self, summary_id: str, email_content: str) -> bool:
@@ -93,19 +236,17 @@ class SummaryStorage:
             return False
 
         summary = self._summaries[summary_id]
-        self._summaries[summary_id] = PodcastSummary(
-            id=summary.id,
-            title=summary.title,
-            show=summary.show,
-            email_content=email_content,
-            transcript=summary.transcript,
-            url=summary.url,
-            duration=summary.duration,
-            created_at=summary.created_at,
-            updated_at=datetime.now().isoformat(),
-            categories=summary.categories,
-        )
-        self._save()
+        # Hydrate first so the rewritten body file keeps the transcript
+        self._hydrate(summary)
+        summary.email_content = email_content
+        summary.updated_at = datetime.now().isoformat()
+        self._write_body(summary)
+        self._rebuild_recent()
+        self._append_wal({
+            "op": "update",
+            "id": summary_id,
+            "fields": {"updated_at": summary.updated_at},
+        })
         return True
 
     def update_categories(self, summary_id: str, category_ids: list[str]) -> bool:
@@ -113,9 +254,17 @@ class SummaryStorage:
         if summary_id not in self._summaries:
             return False
 
-        self._summaries[summary_id].categories = category_ids
-        self._summaries[summary_id].updated_at = datetime.now().isoformat()
-        self._save()
+        summary = self._summaries[summary_id]
+        summary.categories = category_ids
+        summary.updated_at = datetime.now().isoformat()
+        self._append_wal({
+            "op": "update",
+            "id": summary_id,
+            "fields": {
+                "categories": category_ids,
+                "updated_at": summary.updated_at,
+            },
+        })
         return True
 
     def list_all_ids(self) -> list[str]:
@@ -128,21 +277,34 @@ class SummaryStorage:
             return False
 
         del self._summaries[summary_id]
-        self._save()
+        self._hydrated.discard(summary_id)
+        self._body_path(summary_id).unlink(missing_ok=True)
+        self._rebuild_recent()
+        self._append_wal({"op": "delete", "id": summary_id})
         return True
 
     def get_summary(self, summary_id: str) -> Optional[PodcastSummary]:
-        """Get a summary by ID."""
-        return self._summaries.get(summary_id)
+        """Get a summary by ID (cold fields loaded on first access)."""
+        summary = self._summaries.get(summary_id)
+        if summary is not None:
+            self._hydrate(summary)
+        return summary
 
     def list_summaries(self, limit: int = 10) -> list[PodcastSummary]:
         """Get recent summaries, sorted by creation date (newest first)."""
-        summaries = sorted(
-            self._summaries.values(),
-            key=lambda s: s.created_at,
-            reverse=True
-        )
-        return summaries[:limit]
+        if limit <= 10:
+            summaries = list(self._recent)[:limit]
+        else:
+            summaries = sorted(
+                self._summaries.values(),
+                key=lambda s: s.created_at,
+                reverse=True
+            )[:limit]
+        # Callers read email_content off these (search previews), so
+        # hydrate what we hand out; repeat calls hit the hydrated cache
+        for summary in summaries:
+            self._hydrate(summary)
+        return summaries
 
     def count(self) -> int:
         """Get the number of stored summaries."""
@@ -9,6 +9,29 @@ from typing import Optional
 
 import numpy as np
 
+# New embeddings are scalar-quantized to int8: unit-normalize, scale by
+# 127, round. Quarters blob size and memory traffic in the similarity
+# scan at negligible recall cost for normalized sentence embeddings.
+_INT8_SCALE = 127.0
+
+
+def _quantize(embedding: np.ndarray) -> np.ndarray:
+    """Quantize a float embedding to int8 (no-op if already int8)."""
+    if embedding.dtype == np.int8:
+        return embedding
+    vec = embedding.astype(np.float32)
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec = vec / norm
+    return np.clip(np.rint(vec * _INT8_SCALE), -127, 127).astype(np.int8)
+
+
+def _decode(blob: bytes, dtype: str) -> np.ndarray:
+    """Decode a stored embedding blob back to float32."""
+    if dtype == "int8":
+        return np.frombuffer(blob, dtype=np.int8).astype(np.float32) / _INT8_SCALE
+    return np.frombuffer(blob, dtype=np.float32)
+
 
 @dataclass
 class ContentVector:
@@ -55,6 +78,14 @@ class VectorStore:
             CREATE INDEX IF NOT EXISTS idx_created_at ON content_vectors(created_at)
         """)
 
+        # Migration: older databases predate quantized embeddings
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(content_vectors)")}
+        if "embedding_dtype" not in columns:
+            cursor.execute(
+                "ALTER TABLE content_vectors"
+                " ADD COLUMN embedding_dtype TEXT NOT NULL DEFAULT 'float32'"
+            )
+
         conn.commit()
         conn.close()
 
@@ -71,14 +102,14 @@ class VectorStore:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        # Convert embedding to bytes
-        embedding_bytes = embedding.astype(np.float32).tobytes()
+        # Quantize and convert embedding to bytes
+        embedding_bytes = _quantize(embedding).tobytes()
 
         cursor.execute(
             """
             INSERT OR REPLACE INTO content_vectors
-            (id, content_type, title, vault_path, summary, embedding, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            (id, content_type, title, vault_path, summary, embedding, created_at, embedding_dtype)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 'int8')
             """,
             (
                 content_id,
@@ -94,16 +125,52 @@ class VectorStore:
         conn.commit()
         conn.close()
 
+    def add_many(
+        self, rows: list[tuple[str, str, str, str, str, np.ndarray]]
+    ) -> None:
+        """Add many content items in a single transaction.
+
+        Rows are (content_id, content_type, title, vault_path, summary,
+        embedding) tuples. One executemany inside one commit amortizes
+        the fsync cost across the whole batch.
+        """
+        if not rows:
+            return
+
+        now = datetime.now().isoformat()
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO content_vectors
+                (id, content_type, title, vault_path, summary, embedding, created_at, embedding_dtype)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'int8')
+                """,
+                [
+                    (
+                        content_id,
+                        content_type,
+                        title,
+                        vault_path,
+                        summary,
+                        _quantize(embedding).tobytes(),
+                        now,
+                    )
+                    for content_id, content_type, title, vault_path, summary, embedding in rows
+                ],
+            )
+        conn.close()
+
     def get_all_embeddings(self) -> list[tuple[str, np.ndarray]]:
         """Get all content IDs and their embeddings."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        cursor.execute("SELECT id, embedding FROM content_vectors")
+        cursor.execute("SELECT id, embedding, embedding_dtype FROM content_vectors")
         results = []
         for row in cursor.fetchall():
             content_id = row[0]
-            embedding = np.frombuffer(row[1], dtype=np.float32)
+            embedding = _decode(row[1], row[2])
             results.append((content_id, embedding))
 
         conn.close()
@@ -116,7 +183,7 @@ class VectorStore:
 
         cursor.execute(
             """
-            SELECT id, content_type, title, vault_path, summary, embedding, created_at
+            SELECT id, content_type, title, vault_path, summary, embedding, created_at, embedding_dtype
             FROM content_vectors WHERE id = ?
             """,
             (content_id,),
@@ -131,7 +198,7 @@ class VectorStore:
                 title=row[2],
                 vault_path=row[3],
                 summary=row[4],
-                embedding=np.frombuffer(row[5], dtype=np.float32),
+                embedding=_decode(row[5], row[7]),
                 created_at=datetime.fromisoformat(row[6]),
             )
         return None
@@ -142,17 +209,20 @@ class VectorStore:
         top_k: int = 5,
         exclude_id: str | None = None,
         content_type: str | None = None,
+        min_score: float | None = None,
     ) -> list[tuple[ContentVector, float]]:
         """Find the most similar content items using cosine similarity.
 
-        Returns list of (ContentVector, similarity_score) tuples.
+        Returns list of (ContentVector, similarity_score) tuples. When
+        min_score is given, rows below it are dropped during the scan
+        before any ContentVector is materialized.
         """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
         # Build query
         query = """
-            SELECT id, content_type, title, vault_path, summary, embedding, created_at
+            SELECT id, content_type, title, vault_path, summary, embedding, created_at, embedding_dtype
             FROM content_vectors
         """
         params = []
@@ -177,9 +247,11 @@ class VectorStore:
         results = []
 
         for row in rows:
-            embedding = np.frombuffer(row[5], dtype=np.float32)
+            embedding = _decode(row[5], row[7])
             embedding_norm = embedding / np.linalg.norm(embedding)
             similarity = float(np.dot(query_norm, embedding_norm))
+            if min_score is not None and similarity < min_score:
+                continue
 
             content = ContentVector(
                 id=row[0],
@@ -205,7 +277,7 @@ class VectorStore:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        query = "SELECT id, content_type, title, vault_path, summary, embedding, created_at FROM content_vectors WHERE created_at > ?"
+        query = "SELECT id, content_type, title, vault_path, summary, embedding, created_at, embedding_dtype FROM content_vectors WHERE created_at > ?"
         params = [cutoff]
 
         if content_type:
@@ -224,7 +296,7 @@ class VectorStore:
                     title=row[2],
                     vault_path=row[3],
                     summary=row[4],
-                    embedding=np.frombuffer(row[5], dtype=np.float32),
+                    embedding=_decode(row[5], row[7]),
                     created_at=datetime.fromisoformat(row[6]),
                 )
             )
@@ -232,6 +304,28 @@ class VectorStore:
         conn.close()
         return results
 
+    def get_range(self, start: datetime, end: datetime) -> list[tuple[str, str, str, str]]:
+        """Get (content_type, title, summary, vault_path) rows in [start, end).
+
+        A half-open range filter the created_at index can serve directly,
+        with no Python-side post-filter and no embedding deserialization.
+        Timestamps should be naive local time to match how rows are stored.
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT content_type, title, summary, vault_path
+            FROM content_vectors
+            WHERE created_at >= ? AND created_at < ?
+            ORDER BY created_at DESC
+            """,
+            (start.isoformat(), end.isoformat()),
+        )
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+
     def delete(self, content_id: str) -> bool:
         """Delete a content item."""
         conn = sqlite3.connect(self.db_path)
@@ -42,7 +42,11 @@ class TestVectorStore:
         assert result is not None
         assert result.title == "Test Article"
         assert result.content_type == "article"
-        assert np.allclose(result.embedding, embedding)
+        # Storage quantizes to int8, so direction survives, not values:
+        # the round-tripped vector must stay near-parallel to the input
+        unit = embedding / np.linalg.norm(embedding)
+        stored_unit = result.embedding / np.linalg.norm(result.embedding)
+        assert float(np.dot(unit, stored_unit)) > 0.99
 
     def test_find_similar(self, vector_store):
         """Test finding similar content."""